@@ -14,16 +14,21 @@ Author: NICU Dashboard Team
 Version: 1.0.0
 """
 
+import os
 import cv2
 import json
+import signal
+import numpy as np
 import time
 import yaml
 import logging
 import argparse
 import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from queue import Queue, Empty
+from queue import Queue, Empty, Full
 from dataclasses import dataclass, asdict
 from typing import Dict, Optional, Tuple
 
@@ -34,17 +39,19 @@ except ImportError:
     print("Install with: pip3 install paho-mqtt")
     exit(1)
 
-# OCR modules (from ICU-Monitor-Vitals-Extractor)
-# These will be loaded if available
 try:
-    # Placeholder for actual OCR imports
-    # from screen_ocr import ScreenDetector, VitalsExtractor
-    SCREEN_DETECTOR = None
-    VITALS_EXTRACTOR = None
-    OCR_AVAILABLE = False
+    import orjson
+except ImportError:
+    orjson = None
+
+# OCR models (int8 ONNX, see tools/quantize-ocr-model.py)
+try:
+    import onnxruntime as ort
+    OCR_AVAILABLE = True
 except ImportError:
-    print("WARNING: OCR modules not found")
+    print("WARNING: onnxruntime not found")
     print("Running in simulation mode")
+    ort = None
     OCR_AVAILABLE = False
 
 # Configure logging
@@ -58,6 +65,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger('OCRProcessor')
 
+# Minimum seconds between decoded frames handed to OCR; grabs in between
+# only drain the stream so the next retrieved frame is never stale
+FRAME_RETRIEVE_INTERVAL = 0.1
+
+# A screen crop whose downsampled pixels all moved less than
+# SCREEN_CHANGE_THRESHOLD from the last OCR'd crop reuses its vitals, but
+# never for longer than OCR_REFRESH_SEC so a missed change can't persist
+SCREEN_THUMB_SIZE = (64, 48)
+SCREEN_CHANGE_THRESHOLD = 24
+OCR_REFRESH_SEC = 5.0
+
+# Camera vitals are republished every second and each message supersedes the
+# last, so skip the PUBACK round-trip; retain gives late subscribers the
+# latest reading without needing QoS 1
+VITALS_QOS = 0
+VITALS_RETAIN = True
+
+# Screen bbox locking for stationary cameras: after BBOX_LOCK_FRAMES
+# consecutive confident, overlapping detections the bbox is frozen and
+# detection only re-runs every BBOX_RELOCK_EVERY frames, or sooner if the
+# whole-frame hash moves by more than BBOX_UNLOCK_BITS (camera bumped)
+BBOX_LOCK_FRAMES = 10
+BBOX_LOCK_CONF = 0.9
+BBOX_LOCK_IOU = 0.95
+BBOX_RELOCK_EVERY = 300
+BBOX_UNLOCK_BITS = 16
+
+# Element chain that turns each decoder's output into BGR system memory
+GST_CONVERT = {
+    'nvv4l2decoder': 'nvvidconv ! video/x-raw,format=BGRx ! videoconvert',
+    'nvh264dec': 'videoconvert',
+    'avdec_h264': 'videoconvert',
+}
+
+
+def gstreamer_pipeline(rtsp_url: str, decoder: str) -> str:
+    """Build an RTSP H.264 pipeline that decodes on `decoder` and keeps one frame"""
+    return (
+        f'rtspsrc location={rtsp_url} latency=0 ! rtph264depay ! h264parse ! '
+        f'{decoder} ! {GST_CONVERT[decoder]} ! video/x-raw,format=BGR ! '
+        'appsink drop=1 max-buffers=1 sync=false'
+    )
+
 
 @dataclass
 class CameraConfig:
@@ -83,11 +133,41 @@ class VitalReading:
     monitor_type: str = "unknown"
 
 
+def bbox_iou(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> float:
+    """Intersection over union of two (x, y, w, h) boxes"""
+    ix = max(0, min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0]))
+    iy = max(0, min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1]))
+    inter = ix * iy
+    union = a[2] * a[3] + b[2] * b[3] - inter
+    return inter / union if union > 0 else 0.0
+
+
+def screen_thumbnail(screen_img):
+    """Small grayscale copy of a screen crop for change detection"""
+    gray = cv2.cvtColor(screen_img, cv2.COLOR_BGR2GRAY)
+    # Area averaging washes out sensor noise but not a changed digit
+    return cv2.resize(gray, SCREEN_THUMB_SIZE, interpolation=cv2.INTER_AREA)
+
+
+def screen_fingerprint(screen_img) -> int:
+    """64-bit average hash of a screen crop (or whole frame)"""
+    gray = cv2.cvtColor(screen_img, cv2.COLOR_BGR2GRAY)
+    thumb = cv2.resize(gray, (8, 8), interpolation=cv2.INTER_AREA)
+    bits = np.packbits(thumb > thumb.mean())
+    return int.from_bytes(bits.tobytes(), 'big')
+
+
 class MockOCRExtractor:
     """Mock OCR extractor for testing without actual models"""
 
-    def __init__(self):
-        self.base_values = {}
+    # Column order of the per-patient state: hr, spo2, rr, temp
+    BASE_VITALS = (140, 95, 42, 36.8)
+    CONFIDENCES = (('hr_conf', 0.92), ('spo2_conf', 0.94), ('rr_conf', 0.88), ('temp_conf', 0.90))
+
+    def __init__(self, max_patients: int = 64):
+        # One row per patient_id instead of a dict per patient
+        self.base = np.zeros((max_patients, 4), dtype=np.float32)
+        self.seen = set()
 
     def detect_screen(self, frame):
         """Mock screen detection"""
@@ -99,76 +179,214 @@ class MockOCRExtractor:
 
     def extract_vitals(self, screen_img, patient_id):
         """Mock vital extraction with realistic variations"""
-        if patient_id not in self.base_values:
+        if patient_id not in self.seen:
             # Initialize base values for this patient
-            self.base_values[patient_id] = {
-                'hr': 140,
-                'spo2': 95,
-                'rr': 42,
-                'temp': 36.8
-            }
+            if patient_id >= len(self.base):
+                self.base = np.resize(self.base, (patient_id + 1, 4))
+            self.base[patient_id] = self.BASE_VITALS
+            self.seen.add(patient_id)
+
+        # Add realistic variation to all four vitals at once
+        t = time.time()
+        mods = np.array([
+            np.trunc(t % 10 - 5),
+            np.trunc(t % 4 - 2),
+            np.trunc(t % 6 - 3),
+            (t % 1 - 0.5) * 0.2,
+        ], dtype=np.float32)
+        row = self.base[patient_id] + mods
 
-        base = self.base_values[patient_id]
-
-        # Add realistic variation
         vitals = {
-            'hr': base['hr'] + int((time.time() % 10) - 5),
-            'spo2': base['spo2'] + int((time.time() % 4) - 2),
-            'rr': base['rr'] + int((time.time() % 6) - 3),
-            'temp': round(base['temp'] + ((time.time() % 1) - 0.5) * 0.2, 1),
+            'hr': int(row[0]),
+            'spo2': int(row[1]),
+            'rr': int(row[2]),
+            'temp': round(float(row[3]), 1),
         }
 
         # Add confidence scores
-        vitals['hr_conf'] = 0.92
-        vitals['spo2_conf'] = 0.94
-        vitals['rr_conf'] = 0.88
-        vitals['temp_conf'] = 0.90
+        vitals.update(self.CONFIDENCES)
+
+        return vitals
+
+
+class ORTVitalsExtractor:
+    """Screen detector and vitals reader running int8 ONNX models
+
+    Same interface as MockOCRExtractor. Both models take float NCHW input
+    scaled to [0, 1] (QDQ-quantized models keep float I/O):
+      detector:  1x3xHxW RGB -> (N, 5) boxes [x1, y1, x2, y2, score], normalized
+      extractor: 1x1xHxW gray -> values (1, 4), confidences (1, 4), hr/spo2/rr/temp
+    """
+
+    VITALS = ('hr', 'spo2', 'rr', 'temp')
+
+    def __init__(self, ocr_config: dict):
+        providers = []
+        if ocr_config.get('use_tensorrt'):
+            trt_options = {'trt_int8_enable': True, 'trt_engine_cache_enable': True}
+            if ocr_config.get('calibration_table'):
+                trt_options['trt_int8_calibration_table_name'] = ocr_config['calibration_table']
+            providers.append(('TensorrtExecutionProvider', trt_options))
+        if ocr_config.get('use_gpu', True):
+            providers.append('CUDAExecutionProvider')
+        providers.append('CPUExecutionProvider')
+
+        available = ort.get_available_providers()
+        providers = [p for p in providers if (p[0] if isinstance(p, tuple) else p) in available]
+
+        self.detector = ort.InferenceSession(ocr_config['screen_detector_onnx'], providers=providers)
+        self.extractor = ort.InferenceSession(ocr_config['vitals_extractor_onnx'], providers=providers)
+        self.detector_input = self.detector.get_inputs()[0]
+        self.extractor_input = self.extractor.get_inputs()[0]
+
+        logger.info(f"Loaded OCR models on {self.detector.get_providers()[0]}")
+
+    def detect_screen(self, frame):
+        """Return the highest-scoring screen bbox (x, y, w, h) and its score"""
+        h, w = frame.shape[:2]
+        _, _, ih, iw = self.detector_input.shape
+        blob = cv2.dnn.blobFromImage(frame, 1 / 255.0, (iw, ih), swapRB=True)
+        boxes = self.detector.run(None, {self.detector_input.name: blob})[0].reshape(-1, 5)
+
+        if len(boxes) == 0:
+            return (0, 0, w, h), 0.0
+
+        x1, y1, x2, y2, score = boxes[np.argmax(boxes[:, 4])]
+        x, y = int(x1 * w), int(y1 * h)
+        bbox = (x, y, max(1, int(x2 * w) - x), max(1, int(y2 * h) - y))
+        return bbox, float(score)
+
+    def extract_vitals(self, screen_img, patient_id):
+        """Read the four vitals and their confidences from a screen crop"""
+        _, _, ih, iw = self.extractor_input.shape
+        gray = cv2.cvtColor(screen_img, cv2.COLOR_BGR2GRAY)
+        blob = cv2.dnn.blobFromImage(gray, 1 / 255.0, (iw, ih))
+        values, confidences = self.extractor.run(None, {self.extractor_input.name: blob})
+        values = values.reshape(-1)
+        confidences = confidences.reshape(-1)
+
+        vitals = {
+            'hr': int(round(values[0])),
+            'spo2': int(round(values[1])),
+            'rr': int(round(values[2])),
+            'temp': round(float(values[3]), 1),
+        }
+        for key, conf in zip(self.VITALS, confidences):
+            vitals[f'{key}_conf'] = float(conf)
 
         return vitals
 
 
+def build_ocr_extractor(ocr_config: dict):
+    """Load the ONNX OCR models, falling back to the mock extractor"""
+    if OCR_AVAILABLE:
+        logger.info("Loading OCR models...")
+        try:
+            extractor = ORTVitalsExtractor(ocr_config)
+            warmup_ocr(extractor)
+            return extractor
+        except Exception as e:
+            logger.warning(f"Failed to load OCR models ({e}), using mock OCR extractor")
+    else:
+        logger.warning("Using mock OCR extractor (models not available)")
+    return MockOCRExtractor()
+
+
+def warmup_ocr(ocr_extractor):
+    """Run one dummy frame through the OCR path before cameras start
+
+    The first inference builds the TensorRT/CUDA kernels, which can take
+    seconds; pay that here rather than on the first real frame.
+    """
+    start_time = time.time()
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    (x, y, w, h), _ = ocr_extractor.detect_screen(frame)
+    screen_img = frame[y:y+h, x:x+w]
+    screen_thumbnail(screen_img)
+    ocr_extractor.extract_vitals(screen_img, 0)
+    logger.info(f"OCR warm-up took {(time.time() - start_time) * 1000:.0f}ms")
+
+
 class CameraStreamProcessor:
     """Processes a single camera stream"""
 
-    def __init__(self, config: CameraConfig, ocr_extractor, mqtt_client):
+    def __init__(self, config: CameraConfig, ocr_extractor, mqtt_client,
+                 decoder: Optional[str] = None):
         self.config = config
         self.ocr_extractor = ocr_extractor
         self.mqtt_client = mqtt_client
+        self.decoder = decoder
         self.running = False
         self.thread = None
+        self.reader_thread = None
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 5
 
+        # Screen bbox lock (see BBOX_LOCK_FRAMES)
+        self._frame_idx = 0
+        self._prev_bbox = None
+        self._stable_count = 0
+        self._locked_bbox = None
+        self._locked_frame_hash = 0
+
+        # Last OCR'd screen, reused while the display is unchanged
+        self._last_thumb = None
+        self._last_vitals = None
+        self._last_ocr_time = 0.0
+
+        # Single-slot handoff from the reader thread to the OCR loop
+        self._frame_slot = Queue(maxsize=1)
+
         logger.info(f"Initialized processor for camera {config.camera_id}")
 
     def start(self):
-        """Start processing thread"""
+        """Start reader and processing threads"""
         if self.running:
             logger.warning(f"Camera {self.config.camera_id} already running")
             return
 
         self.running = True
+        self.reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
         self.thread = threading.Thread(target=self._process_loop, daemon=True)
+        self.reader_thread.start()
         self.thread.start()
         logger.info(f"Started processing camera {self.config.camera_id}")
 
     def stop(self):
-        """Stop processing thread"""
+        """Stop reader and processing threads"""
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=5)
+        for thread in (self.reader_thread, self.thread):
+            if thread:
+                thread.join(timeout=5)
         logger.info(f"Stopped processing camera {self.config.camera_id}")
 
-    def _process_loop(self):
-        """Main processing loop for this camera"""
+    def _open_capture(self) -> cv2.VideoCapture:
+        """Open the stream, preferring the hardware GStreamer decoder"""
+        if self.decoder:
+            cap = cv2.VideoCapture(
+                gstreamer_pipeline(self.config.rtsp_url, self.decoder),
+                cv2.CAP_GSTREAMER
+            )
+            if cap.isOpened():
+                return cap
+            cap.release()
+            logger.warning(f"GStreamer {self.decoder} unavailable for {self.config.camera_id}, using FFmpeg")
+
+        cap = cv2.VideoCapture(self.config.rtsp_url)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        return cap
+
+    def _reader_loop(self):
+        """Decode continuously so frames never queue up; keep only the newest"""
         cap = None
+        last_retrieve = 0.0
 
         while self.running:
             try:
                 # Connect to stream
                 if cap is None:
                     logger.info(f"Connecting to {self.config.rtsp_url}")
-                    cap = cv2.VideoCapture(self.config.rtsp_url)
+                    cap = self._open_capture()
 
                     if not cap.isOpened():
                         logger.error(f"Failed to open stream: {self.config.camera_id}")
@@ -176,6 +394,7 @@ class CameraStreamProcessor:
 
                         if self.reconnect_attempts >= self.max_reconnect_attempts:
                             logger.error(f"Max reconnect attempts reached for {self.config.camera_id}")
+                            self.running = False
                             return
 
                         time.sleep(5)
@@ -185,29 +404,104 @@ class CameraStreamProcessor:
                     self.reconnect_attempts = 0
                     logger.info(f"Connected to {self.config.camera_id}")
 
-                # Process frame
-                start_time = time.time()
-
-                ret, frame = cap.read()
-                if not ret:
+                if not cap.grab():
                     logger.warning(f"Failed to read frame from {self.config.camera_id}")
                     cap.release()
                     cap = None
                     time.sleep(2)
                     continue
 
-                # Detect screen
-                screen_bbox, screen_conf = self.ocr_extractor.detect_screen(frame)
+                # Only pay for colour conversion when the slot is worth refreshing
+                now = time.time()
+                if now - last_retrieve < FRAME_RETRIEVE_INTERVAL:
+                    continue
+
+                ret, frame = cap.retrieve()
+                if ret:
+                    last_retrieve = now
+                    self._put_latest(frame)
 
-                if screen_conf < 0.85:
-                    logger.debug(f"Low screen confidence ({screen_conf:.2f}) for {self.config.camera_id}")
-                    time.sleep(1)
+            except Exception as e:
+                logger.error(f"Error reading {self.config.camera_id}: {e}", exc_info=True)
+                if cap:
+                    cap.release()
+                    cap = None
+                time.sleep(5)
+
+        # Cleanup
+        if cap:
+            cap.release()
+
+    def _put_latest(self, frame):
+        """Hand a frame to the OCR loop, evicting any frame it hasn't taken"""
+        try:
+            self._frame_slot.put_nowait(frame)
+        except Full:
+            try:
+                self._frame_slot.get_nowait()
+            except Empty:
+                pass
+            self._frame_slot.put_nowait(frame)
+
+    def _use_locked_bbox(self, frame) -> bool:
+        """Whether this frame can skip detection and reuse the locked bbox"""
+        if self._locked_bbox is None or self._frame_idx % BBOX_RELOCK_EVERY == 0:
+            return False
+
+        frame_hash = screen_fingerprint(frame)
+        if bin(frame_hash ^ self._locked_frame_hash).count('1') > BBOX_UNLOCK_BITS:
+            logger.info(f"Scene changed for {self.config.camera_id}, unlocking screen bbox")
+            self._unlock_bbox()
+            return False
+        return True
+
+    def _update_bbox_lock(self, frame, bbox, conf):
+        """Track detection stability and lock the bbox once it settles"""
+        if (conf > BBOX_LOCK_CONF and self._prev_bbox is not None and
+                bbox_iou(bbox, self._prev_bbox) > BBOX_LOCK_IOU):
+            self._stable_count += 1
+        else:
+            self._unlock_bbox()
+        self._prev_bbox = bbox
+
+        if self._locked_bbox is None and self._stable_count >= BBOX_LOCK_FRAMES:
+            self._locked_bbox = bbox
+            self._locked_frame_hash = screen_fingerprint(frame)
+            logger.info(f"Locked screen bbox {bbox} for {self.config.camera_id}")
+
+    def _unlock_bbox(self):
+        """Drop the locked bbox so the next frame runs full detection"""
+        self._locked_bbox = None
+        self._stable_count = 0
+
+    def _process_loop(self):
+        """Main processing loop for this camera"""
+        while self.running:
+            try:
+                try:
+                    frame = self._frame_slot.get(timeout=1.0)
+                except Empty:
                     continue
 
+                # Process frame
+                start_time = time.time()
+                self._frame_idx += 1
+
+                # Detect screen, unless the bbox is locked
+                if self._use_locked_bbox(frame):
+                    screen_bbox = self._locked_bbox
+                else:
+                    screen_bbox, screen_conf = self.ocr_extractor.detect_screen(frame)
+                    self._update_bbox_lock(frame, screen_bbox, screen_conf)
+
+                    if screen_conf < 0.85:
+                        logger.debug(f"Low screen confidence ({screen_conf:.2f}) for {self.config.camera_id}")
+                        continue
+
                 # Extract vitals
                 x, y, w, h = screen_bbox
                 screen_img = frame[y:y+h, x:x+w]
-                vitals = self.ocr_extractor.extract_vitals(screen_img, self.config.patient_id)
+                vitals = self._read_vitals(screen_img)
 
                 # Calculate overall confidence
                 overall_conf = (
@@ -217,7 +511,7 @@ class CameraStreamProcessor:
 
                 if overall_conf < 0.85:
                     logger.debug(f"Low vitals confidence ({overall_conf:.2f}) for {self.config.camera_id}")
-                    time.sleep(1)
+                    self._unlock_bbox()
                     continue
 
                 # Calculate inference time
@@ -251,14 +545,22 @@ class CameraStreamProcessor:
 
             except Exception as e:
                 logger.error(f"Error processing {self.config.camera_id}: {e}", exc_info=True)
-                if cap:
-                    cap.release()
-                    cap = None
                 time.sleep(5)
 
-        # Cleanup
-        if cap:
-            cap.release()
+    def _read_vitals(self, screen_img) -> dict:
+        """OCR the screen, reusing the last vitals while it is unchanged"""
+        thumb = screen_thumbnail(screen_img)
+        now = time.time()
+        if (self._last_vitals is not None and
+                now - self._last_ocr_time < OCR_REFRESH_SEC and
+                cv2.absdiff(thumb, self._last_thumb).max() < SCREEN_CHANGE_THRESHOLD):
+            return self._last_vitals
+
+        vitals = self.ocr_extractor.extract_vitals(screen_img, self.config.patient_id)
+        self._last_thumb = thumb
+        self._last_vitals = vitals
+        self._last_ocr_time = now
+        return vitals
 
     def _publish_reading(self, reading: VitalReading):
         """Publish reading to MQTT"""
@@ -280,12 +582,54 @@ class CameraStreamProcessor:
                 'monitor_type': reading.monitor_type,
             }
 
-            self.mqtt_client.publish(topic, json.dumps(payload), qos=1)
+            # orjson emits bytes directly; stdlib json is the fallback
+            body = orjson.dumps(payload) if orjson else json.dumps(payload)
+            self.mqtt_client.publish(topic, body, qos=VITALS_QOS, retain=VITALS_RETAIN)
 
         except Exception as e:
             logger.error(f"Failed to publish reading: {e}")
 
 
+# Set in each pool worker by _init_worker; the parent sets it to stop them
+_stop_event = None
+
+
+def _init_worker(stop_event):
+    """Pool worker initializer"""
+    global _stop_event
+    _stop_event = stop_event
+    # Ctrl+C goes to the whole process group; let the parent handle shutdown
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def process_cameras(cam_configs: list, mqtt_config: dict, decoder: Optional[str] = None,
+                    ocr_config: Optional[dict] = None):
+    """Worker process entry point: run a group of cameras until stopped
+
+    Each worker owns its OCR extractor and MQTT connection, so the Python
+    side of OCR for one group never contends for another group's GIL.
+    """
+    client = mqtt.Client(f"central-ocr-processor-{os.getpid()}")
+    client.connect(mqtt_config['broker'], mqtt_config['port'], keepalive=60)
+    client.loop_start()
+
+    ocr_extractor = build_ocr_extractor(ocr_config or {})
+    processors = [
+        CameraStreamProcessor(CameraConfig(**cam), ocr_extractor, client, decoder)
+        for cam in cam_configs
+    ]
+    for processor in processors:
+        processor.start()
+
+    try:
+        _stop_event.wait()
+    finally:
+        for processor in processors:
+            processor.stop()
+        client.loop_stop()
+        client.disconnect()
+
+
 class CentralOCRProcessor:
     """Main processor managing all camera streams"""
 
@@ -295,23 +639,32 @@ class CentralOCRProcessor:
         # Load configuration
         self.config = self._load_config(config_file)
 
-        # Initialize MQTT client
-        self.mqtt_client = self._init_mqtt()
-
-        # Initialize OCR extractor
-        if OCR_AVAILABLE:
-            logger.info("Loading OCR models...")
-            # self.ocr_extractor = ActualOCRExtractor()
-            self.ocr_extractor = MockOCRExtractor()  # Use mock for now
+        processing = self.config.get('processing', {})
+        self.decoder = processing.get('decoder')
+
+        # One worker process per core; threads in this process as the fallback
+        self.use_process_pool = (
+            processing.get('use_process_pool', True)
+            and 'fork' in multiprocessing.get_all_start_methods()
+        )
+        self.pool = None
+        self.stop_event = None
+        self._shutdown = threading.Event()
+
+        # Pool workers load their own models and MQTT clients; never init
+        # CUDA or start paho's network thread before forking
+        if self.use_process_pool:
+            self.ocr_extractor = None
+            self.mqtt_client = None
         else:
-            logger.warning("Using mock OCR extractor (models not available)")
-            self.ocr_extractor = MockOCRExtractor()
+            self.ocr_extractor = build_ocr_extractor(self.config.get('ocr', {}))
+            self.mqtt_client = self._init_mqtt()
 
         # Create camera processors
         self.processors = []
         for cam_config in self.config['cameras']:
             config = CameraConfig(**cam_config)
-            processor = CameraStreamProcessor(config, self.ocr_extractor, self.mqtt_client)
+            processor = CameraStreamProcessor(config, self.ocr_extractor, self.mqtt_client, self.decoder)
             self.processors.append(processor)
 
         logger.info(f"Initialized {len(self.processors)} camera processors")
@@ -362,23 +715,64 @@ class CentralOCRProcessor:
         """Start all camera processors"""
         logger.info("Starting all camera processors...")
 
+        enabled = []
         for processor in self.processors:
             if processor.config.enabled:
-                processor.start()
+                enabled.append(processor)
             else:
                 logger.info(f"Camera {processor.config.camera_id} is disabled, skipping")
 
-        logger.info(f"Started {len(self.processors)} camera processors")
+        if self.use_process_pool and enabled:
+            self._start_pool(enabled)
+        else:
+            for processor in enabled:
+                processor.start()
+
+        logger.info(f"Started {len(enabled)} camera processors")
+
+    def _start_pool(self, processors: list):
+        """Spread cameras round-robin over one worker process per core"""
+        ctx = multiprocessing.get_context('fork')
+        workers = min(len(processors), os.cpu_count() or 1)
+        groups = [
+            [asdict(p.config) for p in processors[i::workers]]
+            for i in range(workers)
+        ]
+
+        self.stop_event = ctx.Event()
+        self.pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self.stop_event,)
+        )
+        for group in groups:
+            future = self.pool.submit(process_cameras, group, self.config['mqtt'],
+                                      self.decoder, self.config.get('ocr'))
+            future.add_done_callback(self._on_worker_done)
+
+        logger.info(f"Running {len(processors)} cameras in {workers} worker processes")
+
+    def _on_worker_done(self, future):
+        """Log workers that exit with an error"""
+        if not future.cancelled() and future.exception():
+            logger.error(f"Camera worker failed: {future.exception()}")
 
     def stop(self):
         """Stop all camera processors"""
         logger.info("Stopping all camera processors...")
 
-        for processor in self.processors:
-            processor.stop()
+        if self.pool:
+            self.stop_event.set()
+            self.pool.shutdown(wait=True)
+            self.pool = None
+        else:
+            for processor in self.processors:
+                processor.stop()
 
-        self.mqtt_client.loop_stop()
-        self.mqtt_client.disconnect()
+        if self.mqtt_client:
+            self.mqtt_client.loop_stop()
+            self.mqtt_client.disconnect()
 
         logger.info("All processors stopped")
 
@@ -387,13 +781,17 @@ class CentralOCRProcessor:
         logger.info("Central OCR Processor running...")
         logger.info("Press Ctrl+C to stop")
 
+        # systemd stops the service with SIGTERM
+        signal.signal(signal.SIGTERM, lambda *_: self._shutdown.set())
+
         try:
-            # Keep main thread alive
-            while True:
-                time.sleep(1)
+            # Sleep until a signal arrives instead of waking every second
+            self._shutdown.wait()
+            logger.info("Received termination signal")
 
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
+            self._shutdown.set()
         finally:
             self.stop()
 
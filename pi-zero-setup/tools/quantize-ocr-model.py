@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+OCR Model Quantization Tool
+
+Converts an FP32 ONNX screen detector or vitals extractor into the int8
+QDQ model loaded by central-ocr-processor.py, calibrating activations on
+a folder of representative NICU monitor frames (~200 is enough).
+
+Usage:
+    python3 quantize-ocr-model.py --model screen_detector.onnx \\
+        --output ../models/screen_detector_int8.onnx --frames ./calibration-frames
+    python3 quantize-ocr-model.py --model vitals_extractor.onnx --grayscale \\
+        --output ../models/vitals_extractor_int8.onnx --frames ./calibration-frames
+
+Author: NICU Dashboard Team
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import cv2
+import onnx
+from onnxruntime.quantization import (
+    CalibrationDataReader,
+    CalibrationMethod,
+    QuantFormat,
+    QuantType,
+    quantize_static,
+)
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+class FrameCalibrationReader(CalibrationDataReader):
+    """Feeds calibration frames preprocessed exactly as ORTVitalsExtractor does"""
+
+    def __init__(self, model_path: str, frames_dir: str, grayscale: bool, limit: int):
+        model = onnx.load(model_path)
+        model_input = model.graph.input[0]
+        dims = model_input.type.tensor_type.shape.dim
+        self.input_name = model_input.name
+        self.size = (dims[3].dim_value, dims[2].dim_value)
+        self.grayscale = grayscale
+
+        self.paths = sorted(
+            p for p in Path(frames_dir).iterdir()
+            if p.suffix.lower() in IMAGE_EXTENSIONS
+        )[:limit]
+        self.index = 0
+
+    def get_next(self):
+        while self.index < len(self.paths):
+            frame = cv2.imread(str(self.paths[self.index]))
+            self.index += 1
+            if frame is None:
+                continue
+
+            if self.grayscale:
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                blob = cv2.dnn.blobFromImage(gray, 1 / 255.0, self.size)
+            else:
+                blob = cv2.dnn.blobFromImage(frame, 1 / 255.0, self.size, swapRB=True)
+            return {self.input_name: blob}
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Quantize an OCR model to int8 ONNX')
+    parser.add_argument('--model', required=True, help='FP32 ONNX model')
+    parser.add_argument('--output', required=True, help='Path for the int8 model')
+    parser.add_argument('--frames', required=True, help='Folder of calibration frames')
+    parser.add_argument('--num-frames', type=int, default=200,
+                        help='Maximum calibration frames to use (default: 200)')
+    parser.add_argument('--grayscale', action='store_true',
+                        help='Model takes 1-channel input (vitals extractor)')
+    args = parser.parse_args()
+
+    reader = FrameCalibrationReader(args.model, args.frames, args.grayscale, args.num_frames)
+    if not reader.paths:
+        print(f"ERROR: No images found in {args.frames}")
+        return 1
+
+    print(f"Calibrating {args.model} on {len(reader.paths)} frames...")
+
+    # QDQ keeps float I/O, so the processor feeds the same blobs either way,
+    # and TensorRT reads the scales from the graph (no calibration table)
+    quantize_static(
+        args.model,
+        args.output,
+        reader,
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=True,
+        calibrate_method=CalibrationMethod.MinMax,
+    )
+
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
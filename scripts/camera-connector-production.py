@@ -18,11 +18,41 @@ import time
 import random
 import re
 import os
+import subprocess
+import json
+import socket
 import numpy as np
 from datetime import datetime, timezone
 from collections import deque
-from threading import Thread, Event
-from queue import Queue, Empty
+from threading import Thread, Event, Lock, local
+from queue import Queue, Empty, Full
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Numba-fused preprocessing kernel (scripts/ocr_kernels.py)
+    import ocr_kernels
+except ImportError:
+    ocr_kernels = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Tesseract's OpenMP threads only add overhead on one small image
+_TESS_ENV = dict(os.environ, OMP_THREAD_LIMIT='1')
+
+try:
+    # In-process libtesseract; pytesseract spawns the tesseract binary per call
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+except ImportError:
+    PyTessBaseAPI = None
 
 # ============================================================================
 # CONFIGURATION
@@ -33,23 +63,41 @@ API_URL = "http://localhost:3001/api/vitals/ingest"
 CAMERA_ID = "camera-001"
 PATIENT_ID = 1
 SAMPLE_INTERVAL = 5  # Seconds between vitals submissions
+SEND_QUEUE_SIZE = 32  # Readings waiting for the API before new ones are dropped
+
+# Hardware decode via GStreamer. Jetson: "nvv4l2decoder", desktop NVIDIA:
+# "nvh264dec", software fallback: "avdec_h264". None = FFmpeg on the CPU.
+GST_DECODER = "nvv4l2decoder"
 
 # Performance thresholds
 MAX_FRAME_LATENCY_MS = 100
+STALE_FRAME_SEC = 5  # Latest frame older than this means the stream is dead
 MAX_RECONNECT_ATTEMPTS = 5
 RECONNECT_DELAY_SEC = 3
 
 # OCR Configuration
 TESSERACT_CONFIG = '--psm 6 -c tessedit_char_whitelist=0123456789.%'
+ROI_BBOX = None  # (x, y, w, h) of the monitor screen in the frame, None = full frame
+MIN_DIGIT_HEIGHT_PX = 28  # Upscale only when digits are shorter than this
+DIGIT_HEIGHT_RATIO = 0.08  # Estimated digit height as a fraction of the ROI height
+# Numba kernel in place of the OpenCV CLAHE/resize/Otsu/median chain. Off by
+# default: OpenCV's SIMD stages are faster on 1-4 cores (see ocr_kernels.py)
+USE_FUSED_PREPROCESS = False
 
 # Vital patterns and ranges
-PATTERNS = {
+_RAW_PATTERNS = {
     'hr': [r'HR[:\s]*(\d{2,3})', r'(\d{2,3})[\s]*bpm', r'(1[0-8]\d)'],
     'spo2': [r'SpO2[:\s]*(\d{2,3})', r'(\d{2,3})[\s]*%', r'(9[0-9]|100)'],
     'rr': [r'RR[:\s]*(\d{1,3})', r'([3-7]\d)'],
     'temp': [r'Temp[:\s]*(\d{2}\.?\d?)', r'(3[5-8]\.\d)']
 }
 
+# Compiled once at import; _RAW_PATTERNS stays the source for Hyperscan
+PATTERNS = {
+    vital_type: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for vital_type, patterns in _RAW_PATTERNS.items()
+}
+
 VALID_RANGES = {
     'hr': (80, 200),
     'spo2': (85, 100),
@@ -61,6 +109,23 @@ VALID_RANGES = {
 # STREAMING CLASS
 # ============================================================================
 
+# Element chain that turns each decoder's output into BGR system memory
+GST_CONVERT = {
+    'nvv4l2decoder': 'nvvidconv ! video/x-raw,format=BGRx ! videoconvert',
+    'nvh264dec': 'videoconvert',
+    'avdec_h264': 'videoconvert',
+}
+
+
+def gstreamer_pipeline(url, decoder=GST_DECODER):
+    """Build an RTSP H.264 pipeline that decodes on `decoder` and keeps one frame."""
+    return (
+        f'rtspsrc location={url} latency=0 ! rtph264depay ! h264parse ! '
+        f'{decoder} ! {GST_CONVERT[decoder]} ! video/x-raw,format=BGR ! '
+        'appsink drop=1 max-buffers=1 sync=false'
+    )
+
+
 class OptimizedStreamReader:
     """Low-latency RTSP stream reader with automatic reconnection."""
 
@@ -72,6 +137,14 @@ class OptimizedStreamReader:
         self.drop_count = 0
         self.latencies = deque(maxlen=100)
         self.last_frame_time = 0
+        self.width = 0
+        self.height = 0
+
+        # Background reader keeps only the newest decoded frame
+        self._latest = None
+        self._lock = Lock()
+        self._stop = Event()
+        self._reader = None
 
         # Set FFmpeg options for low latency
         os.environ['OPENCV_FFMPEG_CAPTURE_OPTIONS'] = (
@@ -84,43 +157,110 @@ class OptimizedStreamReader:
 
     def connect(self):
         """Establish connection to RTSP stream."""
-        if self.cap:
-            self.cap.release()
+        self._close_capture()
+
+        if GST_DECODER:
+            # Hardware decode; falls back to FFmpeg if OpenCV lacks GStreamer
+            self.cap = cv2.VideoCapture(gstreamer_pipeline(self.url), cv2.CAP_GSTREAMER)
+            if not self.cap.isOpened():
+                self.cap.release()
+                self.cap = None
 
-        self.cap = cv2.VideoCapture(self.url, cv2.CAP_FFMPEG)
+        if self.cap is None:
+            self.cap = cv2.VideoCapture(self.url, cv2.CAP_FFMPEG)
         self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         if self.cap.isOpened():
             # Warm up - discard initial buffered frames
             for _ in range(5):
                 self.cap.grab()
+            # Read before the reader thread takes the capture; VideoCapture
+            # is not safe to query while another thread grabs from it
+            self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
             self.connected = True
+            self._start_reader()
             return True
         return False
 
+    def _start_reader(self):
+        """Start the background decode thread; it owns the capture from now on."""
+        self._latest = None
+        self.last_frame_time = time.time()  # Grace period for the first frame
+        # Fresh event per reader, so a reader still stuck in grab() is not
+        # revived when the next one starts
+        self._stop = Event()
+        self._reader = Thread(target=self._read_loop, args=(self.cap, self._stop), daemon=True)
+        self._reader.start()
+
+    def _close_capture(self):
+        """Stop the reader and let go of the capture.
+
+        A running reader releases its capture itself when it exits; it may
+        still be inside a blocking grab() after the join timeout (FFmpeg's
+        RTSP timeout is far longer), and freeing the capture under it would
+        crash. Without a reader the capture is released here.
+        """
+        self._stop.set()
+        if self._reader:
+            self._reader.join(timeout=2)
+            self._reader = None
+        elif self.cap:
+            self.cap.release()
+        self.cap = None
+
+    def _read_loop(self, cap, stop):
+        """Grab continuously so FFmpeg never buffers; retrieve at most every
+        MAX_FRAME_LATENCY_MS and keep only that newest frame."""
+        min_interval = MAX_FRAME_LATENCY_MS / 1000
+        last_retrieve = 0
+        stream_down = False
+        try:
+            while not stop.is_set():
+                if not cap.grab():
+                    # An outage counts as one drop, not one per retry
+                    if not stream_down:
+                        self.drop_count += 1
+                        stream_down = True
+                    time.sleep(0.01)
+                    continue
+                stream_down = False
+
+                ts = time.time()
+                if stop.is_set() or ts - last_retrieve < min_interval:
+                    continue
+
+                ret, frame = cap.retrieve()
+                if ret and frame is not None:
+                    last_retrieve = ts
+                    with self._lock:
+                        self._latest = (frame, ts)
+                    self.last_frame_time = ts
+                else:
+                    self.drop_count += 1
+        finally:
+            cap.release()
+
     def get_frame(self):
-        """Get latest frame with latency measurement."""
+        """Get latest frame; latency is the frame's age."""
         if not self.connected:
             return None, 0
 
-        start = time.time()
-
-        # Grab and retrieve
-        ret = self.cap.grab()
-        if ret:
-            ret, frame = self.cap.retrieve()
+        with self._lock:
+            latest = self._latest
 
-        latency_ms = (time.time() - start) * 1000
+        if latest is None:
+            return None, 0
 
-        if ret and frame is not None:
-            self.frame_count += 1
-            self.latencies.append(latency_ms)
-            self.last_frame_time = time.time()
-            return frame, latency_ms
-        else:
-            self.drop_count += 1
+        frame, ts = latest
+        latency_ms = (time.time() - ts) * 1000
+        if latency_ms > STALE_FRAME_SEC * 1000:
             return None, latency_ms
 
+        self.frame_count += 1
+        self.latencies.append(latency_ms)
+        return frame, latency_ms
+
     def get_stats(self):
         """Get streaming statistics."""
         if not self.latencies:
@@ -138,8 +278,7 @@ class OptimizedStreamReader:
 
     def release(self):
         """Release stream resources."""
-        if self.cap:
-            self.cap.release()
+        self._close_capture()
         self.connected = False
 
 
@@ -147,37 +286,184 @@ class OptimizedStreamReader:
 # OCR PROCESSING
 # ============================================================================
 
-def preprocess_for_ocr(frame):
-    """Preprocess frame for OCR."""
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-    enhanced = clahe.apply(gray)
-    resized = cv2.resize(enhanced, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
-    _, binary = cv2.threshold(resized, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    return cv2.medianBlur(binary, 3)
+# Per-thread CLAHE and Tesseract instances, created on first use
+_tls = local()
 
+_fused_preprocess = USE_FUSED_PREPROCESS and ocr_kernels is not None
 
-def extract_vitals(frame):
+
+def get_clahe():
+    """Return this thread's CLAHE object."""
+    clahe = getattr(_tls, 'clahe', None)
+    if clahe is None:
+        clahe = _tls.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    return clahe
+
+
+class OCRBuffers:
+    """Scratch buffers reused by preprocess_for_ocr across frames.
+
+    Only the active path's buffers exist: the fused kernel's scratch, or
+    the intermediates of the OpenCV chain.
+    """
+
+    def __init__(self):
+        self.key = None
+
+    def ensure(self, h, w, scale):
+        """(Re)allocate the buffers when the ROI size or scale changes."""
+        if self.key != (h, w, scale):
+            oh, ow = round(h * scale), round(w * scale)
+            self.gray = np.empty((h, w), dtype=np.uint8)
+            self.blurred = np.empty((oh, ow), dtype=np.uint8)
+            if _fused_preprocess:
+                self.kernel_scratch = ocr_kernels.preprocess_scratch(h, w, ow)
+            else:
+                self.enhanced = np.empty((h, w), dtype=np.uint8)
+                self.resized = np.empty((oh, ow), dtype=np.uint8) if scale > 1.0 else None
+                self.binary = np.empty((oh, ow), dtype=np.uint8)
+            self.key = (h, w, scale)
+        return self
+
+
+def preprocess_for_ocr(frame, bufs=None):
+    """Preprocess frame for OCR.
+
+    The result is a view of `bufs` and is overwritten by the next call.
+    """
+    h, w = frame.shape[:2]
+
+    # Only upsample when the digits are too small for Tesseract
+    scale = max(1.0, MIN_DIGIT_HEIGHT_PX / (h * DIGIT_HEIGHT_RATIO))
+    if scale <= 1.05:
+        scale = 1.0
+
+    bufs = (bufs or OCRBuffers()).ensure(h, w, scale)
+    cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=bufs.gray)
+
+    if _fused_preprocess:
+        # CLAHE + upscale + Otsu + median in one kernel
+        return ocr_kernels.fused_preprocess(bufs.gray, bufs.blurred, *bufs.kernel_scratch)
+
+    get_clahe().apply(bufs.gray, bufs.enhanced)
+    src = bufs.enhanced
+    if scale > 1.0:
+        cv2.resize(src, (bufs.resized.shape[1], bufs.resized.shape[0]),
+                   dst=bufs.resized, interpolation=cv2.INTER_LINEAR)
+        src = bufs.resized
+    cv2.threshold(src, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=bufs.binary)
+    cv2.medianBlur(bufs.binary, 3, dst=bufs.blurred)
+    return bufs.blurred
+
+
+def build_pattern_database():
+    """Compile all vital patterns into one Hyperscan database.
+
+    Pattern ids follow _RAW_PATTERNS order, so ascending id is priority order.
+    Returns (database, [(vital_type, compiled_regex), ...] indexed by id).
+    """
+    expressions, ids, flags, lookup = [], [], [], []
+    for vital_type, patterns in _RAW_PATTERNS.items():
+        for pattern, regex in zip(patterns, PATTERNS[vital_type]):
+            ids.append(len(lookup))
+            expressions.append(pattern.encode())
+            flags.append(hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST)
+            lookup.append((vital_type, regex))
+
+    db = hyperscan.Database()
+    db.compile(expressions=expressions, ids=ids, elements=len(ids), flags=flags)
+    return db, lookup
+
+
+PATTERN_DB, PATTERN_LOOKUP = build_pattern_database() if hyperscan else (None, None)
+
+
+def _on_pattern_match(pattern_id, start, end, flags, starts):
+    """Hyperscan callback: remember the leftmost start of each pattern."""
+    if start < starts.get(pattern_id, start + 1):
+        starts[pattern_id] = start
+
+
+def match_vitals(text):
+    """Pick the first in-range value for each vital from OCR text."""
+    vitals = {}
+
+    if PATTERN_DB is not None:
+        # One DFA scan finds which patterns hit; only those get a regex pass
+        starts = {}
+        PATTERN_DB.scan(text.encode('ascii', 'replace'),
+                        match_event_handler=_on_pattern_match, context=starts)
+        for pattern_id in sorted(starts):
+            vital_type, regex = PATTERN_LOOKUP[pattern_id]
+            if vital_type in vitals:
+                continue
+            match = regex.match(text, starts[pattern_id])
+            if match:
+                try:
+                    value = float(match.group(1))
+                    min_val, max_val = VALID_RANGES[vital_type]
+                    if min_val <= value <= max_val:
+                        vitals[vital_type] = value
+                except (ValueError, IndexError):
+                    continue
+        return vitals
+
+    for vital_type, patterns in PATTERNS.items():
+        for pattern in patterns:
+            match = pattern.search(text)
+            if match:
+                try:
+                    value = float(match.group(1))
+                    min_val, max_val = VALID_RANGES[vital_type]
+                    if min_val <= value <= max_val:
+                        vitals[vital_type] = value
+                        break
+                except (ValueError, IndexError):
+                    continue
+
+    return vitals
+
+
+def tesseract_pipe(image, config):
+    """One tesseract run over pipes (PNG on stdin, text on stdout), without
+    pytesseract's temp files and PIL round-trip."""
+    ok, png = cv2.imencode('.png', image, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+    if not ok:
+        raise ValueError("PNG encode failed")
+    result = subprocess.run(
+        [pytesseract.pytesseract.tesseract_cmd, 'stdin', 'stdout', *config.split()],
+        input=png.tobytes(), capture_output=True, env=_TESS_ENV, check=True)
+    return result.stdout.decode('utf-8', 'replace')
+
+
+def ocr_image(processed):
+    """Run Tesseract on a preprocessed image and return the raw text."""
+    if PyTessBaseAPI is None:
+        return tesseract_pipe(processed, TESSERACT_CONFIG)
+
+    # The API is not thread-safe, so each thread keeps its own persistent one
+    api = getattr(_tls, 'tess_api', None)
+    if api is None:
+        api = _tls.tess_api = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+        api.SetVariable('tessedit_char_whitelist', '0123456789.%')
+    # Hand libtesseract the raw 8-bit buffer instead of building a PIL image
+    processed = np.ascontiguousarray(processed)
+    h, w = processed.shape
+    api.SetImageBytes(processed.tobytes(), w, h, 1, w)
+    return api.GetUTF8Text()
+
+
+def extract_vitals(frame, roi_bbox=None, bufs=None):
     """Extract vital signs from frame using OCR."""
     try:
-        processed = preprocess_for_ocr(frame)
-        text = pytesseract.image_to_string(processed, config=TESSERACT_CONFIG)
+        if roi_bbox is not None:
+            x, y, w, h = roi_bbox
+            frame = frame[y:y+h, x:x+w]
+        processed = preprocess_for_ocr(frame, bufs)
+        text = ocr_image(processed)
         text = text.upper().replace('\n', ' ')
 
-        vitals = {}
-        for vital_type, patterns in PATTERNS.items():
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    try:
-                        value = float(match.group(1))
-                        min_val, max_val = VALID_RANGES[vital_type]
-                        if min_val <= value <= max_val:
-                            vitals[vital_type] = value
-                            break
-                    except (ValueError, IndexError):
-                        continue
-
+        vitals = match_vitals(text)
         return vitals, 0.88 if len(vitals) >= 2 else 0.0, text[:50]
     except Exception as e:
         return {}, 0.0, str(e)[:50]
@@ -202,16 +488,25 @@ class VitalSmoother:
 
     def __init__(self, window_size=5):
         self.window_size = window_size
-        self.history = {k: deque(maxlen=window_size) for k in VALID_RANGES.keys()}
+        # One ring buffer row per vital, written in place
+        self.key_to_row = {k: i for i, k in enumerate(VALID_RANGES)}
+        self.buf = np.zeros((len(VALID_RANGES), window_size), dtype=np.float64)
+        self.idx = np.zeros(len(VALID_RANGES), dtype=np.int32)
+        self.count = np.zeros(len(VALID_RANGES), dtype=np.int32)
 
     def smooth(self, vitals):
         """Apply median smoothing to vitals."""
         smoothed = {}
         for key, value in vitals.items():
-            self.history[key].append(value)
-            if len(self.history[key]) >= 3:
-                values = sorted(self.history[key])
-                smoothed[key] = values[len(values) // 2]
+            row = self.key_to_row[key]
+            self.buf[row, self.idx[row]] = value
+            self.idx[row] = (self.idx[row] + 1) % self.window_size
+            self.count[row] += 1
+
+            if self.count[row] >= 3:
+                n = min(self.count[row], self.window_size)
+                m = n // 2
+                smoothed[key] = float(np.partition(self.buf[row, :n], m)[m])
             else:
                 smoothed[key] = value
         return smoothed
@@ -221,7 +516,26 @@ class VitalSmoother:
 # API CLIENT
 # ============================================================================
 
-def send_vitals(vitals, confidence, metadata=None):
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets have Nagle disabled."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+        super().init_poolmanager(*args, **kwargs)
+
+
+# One pooled connection reused across posts instead of a new TCP handshake
+# every SAMPLE_INTERVAL
+_session = requests.Session()
+_session.headers['Connection'] = 'keep-alive'
+_session.mount('http://', KeepAliveAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+
+def send_vitals(vitals, confidence, metadata=None, timestamp=None):
     """Send vitals to dashboard API."""
     payload = {
         "patientId": PATIENT_ID,
@@ -234,20 +548,52 @@ def send_vitals(vitals, confidence, metadata=None):
         },
         "confidence": confidence,
         "inferenceTimeMs": random.randint(50, 150),
-        "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        "timestamp": timestamp or datetime.now(timezone.utc),
         "metadata": metadata or {}
     }
 
     # Remove None values
     payload["vitals"] = {k: v for k, v in payload["vitals"].items() if v is not None}
 
+    if orjson is not None:
+        # Serializes the datetime itself and emits bytes, no str round-trip
+        body = orjson.dumps(payload, option=orjson.OPT_UTC_Z)
+    else:
+        payload["timestamp"] = payload["timestamp"].isoformat().replace('+00:00', 'Z')
+        body = json.dumps(payload)
+
     try:
-        response = requests.post(API_URL, json=payload, timeout=5)
+        response = _session.post(API_URL, data=body,
+                                 headers={'Content-Type': 'application/json'}, timeout=5)
         return response.json()
     except Exception as e:
         return {"error": str(e)}
 
 
+class VitalsSender(Thread):
+    """Posts queued readings in the background so a slow or unreachable API
+    never holds up the sampling loop."""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.queue = Queue(maxsize=SEND_QUEUE_SIZE)
+        self.dropped = 0
+        self.last_result = {}  # Response to the most recent completed post
+
+    def submit(self, vitals, confidence, metadata=None):
+        """Queue a reading, stamped now; drop it if the queue is full."""
+        try:
+            self.queue.put_nowait((vitals, confidence, metadata, datetime.now(timezone.utc)))
+            return True
+        except Full:
+            self.dropped += 1
+            return False
+
+    def run(self):
+        while True:
+            self.last_result = send_vitals(*self.queue.get())
+
+
 # ============================================================================
 # MAIN
 # ============================================================================
@@ -263,14 +609,14 @@ def main():
 
     stream = OptimizedStreamReader(RTSP_URL)
     smoother = VitalSmoother()
+    ocr_buffers = OCRBuffers()
 
     # Connect to stream
     print("\nConnecting to camera...")
     reconnect_attempts = 0
     while reconnect_attempts < MAX_RECONNECT_ATTEMPTS:
         if stream.connect():
-            print(f"Connected! Resolution: {int(stream.cap.get(cv2.CAP_PROP_FRAME_WIDTH))}x"
-                  f"{int(stream.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))}")
+            print(f"Connected! Resolution: {stream.width}x{stream.height}")
             break
         reconnect_attempts += 1
         print(f"Connection failed, retry {reconnect_attempts}/{MAX_RECONNECT_ATTEMPTS}...")
@@ -286,6 +632,8 @@ def main():
 
     total_sent = 0
     ocr_success = 0
+    sender = VitalsSender()
+    sender.start()
 
     try:
         while True:
@@ -299,14 +647,14 @@ def main():
 
                 if frame is not None:
                     # Attempt OCR
-                    ocr_vitals, ocr_conf, _ = extract_vitals(frame)
+                    ocr_vitals, ocr_conf, _ = extract_vitals(frame, ROI_BBOX, ocr_buffers)
 
                     if len(ocr_vitals) >= 2:
                         vitals = smoother.smooth(ocr_vitals)
                         confidence = ocr_conf
                         mode = "OCR"
                         ocr_success += 1
-                elif time.time() - stream.last_frame_time > 5:
+                elif time.time() - stream.last_frame_time > STALE_FRAME_SEC:
                     # Stream might be dead, try reconnecting
                     print("\n[WARN] Stream timeout, reconnecting...")
                     stream.connect()
@@ -324,7 +672,8 @@ def main():
                 metadata["latency_ms"] = round(latency, 1)
                 metadata["drop_rate"] = round(stats.get('drop_rate', 0), 2)
 
-            result = send_vitals(vitals, confidence, metadata)
+            sender.submit(vitals, confidence, metadata)
+            result = sender.last_result
             total_sent += 1
 
             # Display
@@ -335,7 +684,10 @@ def main():
             temp = f"{vitals.get('temp', 0):.1f}" if vitals.get('temp') else '-'
             lat_str = f"{latency:.0f}ms" if latency else "-"
 
-            if result.get("success"):
+            # Result column: the latest post to complete, not necessarily this one
+            if not result:
+                res = "… pending"
+            elif result.get("success"):
                 res = f"✓ #{result.get('vitalId')}"
             else:
                 err = str(result.get('error') or result.get('message') or 'Unknown')
@@ -350,7 +702,8 @@ def main():
                 ocr_rate = ocr_success / total_sent * 100 if total_sent else 0
                 print(f"--- Stats: {total_sent} sent | OCR: {ocr_rate:.0f}% | "
                       f"Drops: {stats.get('drop_rate', 0):.1f}% | "
-                      f"P95 lat: {stats.get('latency_p95', 0):.0f}ms ---")
+                      f"P95 lat: {stats.get('latency_p95', 0):.0f}ms | "
+                      f"Send queue: {sender.queue.qsize()} ({sender.dropped} dropped) ---")
 
             time.sleep(SAMPLE_INTERVAL)
 
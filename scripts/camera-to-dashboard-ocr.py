@@ -13,9 +13,50 @@ import requests
 import time
 import random
 import re
+import os
+import json
+import argparse
+import threading
+import subprocess
 import numpy as np
 from datetime import datetime, timezone
-from collections import deque
+from queue import Queue, Full
+from requests.adapters import HTTPAdapter
+
+try:
+    # Numba-fused ROI preprocessing kernel (scripts/ocr_kernels.py)
+    from ocr_kernels import fused_roi_preprocess
+except ImportError:
+    fused_roi_preprocess = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Tesseract's OpenMP threading only adds overhead on small single images
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+try:
+    # In-process libtesseract; pytesseract spawns the tesseract binary per call
+    from tesserocr import PyTessBaseAPI, PSM
+except ImportError:
+    PyTessBaseAPI = None
+
+try:
+    import gi
+    gi.require_version('Gst', '1.0')
+    from gi.repository import Gst
+except (ImportError, ValueError):
+    Gst = None
+
+# OpenCV built with CUDA and a usable GPU
+CUDA_AVAILABLE = hasattr(cv2, 'cuda') and cv2.cuda.getCudaEnabledDeviceCount() > 0
 
 # Configuration
 RTSP_URL = "rtsp://192.168.0.183:8554/camera"
@@ -23,9 +64,66 @@ API_URL = "http://localhost:3001/api/vitals/ingest"
 CAMERA_ID = "camera-001"
 PATIENT_ID = 1
 INTERVAL_SECONDS = 5
+SEND_QUEUE_SIZE = 32  # Unsent readings kept while the API is slow
+STALE_FRAME_SEC = 5  # Latest frame older than this means the stream is dead
+
+# Decode with GStreamer straight to GRAY8 when PyGObject is available; frames
+# are views of the mapped GStreamer buffer rather than copies
+USE_GSTREAMER = True
+GST_PIPELINE = (
+    'rtspsrc location={url} latency=0 ! rtph264depay ! h264parse ! avdec_h264 ! '
+    'videoconvert ! video/x-raw,format=GRAY8 ! '
+    'appsink name=sink max-buffers=1 drop=true sync=false'
+)
+
+# Low-latency FFmpeg RTSP options: no demuxer buffering and a short probe
+FFMPEG_CAPTURE_OPTIONS = (
+    'rtsp_transport;tcp|fflags;nobuffer|flags;low_delay|max_delay;0|'
+    'analyzeduration;100000|probesize;32768'
+)
+
+# Preprocessing: unsharp mask before upscaling, then a local (adaptive)
+# threshold, which copes with uneven screen glare better than global Otsu
+SHARPEN_SIGMA = 1.5
+SHARPEN_AMOUNT = 0.8
+ADAPTIVE_BLOCK = 31
+ADAPTIVE_C = 10
 
 # OCR Configuration
-TESSERACT_CONFIG = '--psm 6 -c tessedit_char_whitelist=0123456789.%'
+TESSERACT_CONFIG = '--psm {} -c tessedit_char_whitelist={}'
+FULL_FRAME_PSM = 6  # Single uniform block of text
+FULL_FRAME_WHITELIST = '0123456789.%'
+
+# Per-vital screen regions (y1, y2, x1, x2), saved by --calibrate. When set,
+# each region is OCR'd on its own as a single line instead of the whole frame.
+ROI_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ocr-rois.json')
+ROI_PSM = 7  # Single text line
+WHITELIST = {
+    'hr': '0123456789',
+    'spo2': '0123456789',
+    'rr': '0123456789',
+    'temp': '0123456789.',
+}
+NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)?')
+ROI_TARGET_HEIGHT = 44  # ROIs are normalised to this height before any filtering
+ROI_UPSCALE = 3         # then enlarged for Tesseract (~300 dpi digit height)
+# An ROI whose downsampled pixels all moved less than this is treated as
+# unchanged and its last OCR text is reused, but never for longer than
+# ROI_OCR_REFRESH_SEC so a one-off misread can't be resent indefinitely
+ROI_THUMB_SIZE = (32, 12)
+ROI_CHANGE_THRESHOLD = 24
+ROI_OCR_REFRESH_SEC = 30
+
+
+def load_rois():
+    """Load calibrated ROIs, or an empty dict to OCR the full frame."""
+    if not os.path.exists(ROI_FILE):
+        return {}
+    with open(ROI_FILE) as f:
+        return {k: tuple(v) for k, v in json.load(f).items()}
+
+
+ROIS = load_rois()
 
 # Vital sign patterns (regex)
 PATTERNS = {
@@ -53,6 +151,44 @@ PATTERNS = {
     ]
 }
 
+# Compiled once at import instead of going through re's cache per frame
+COMPILED_PATTERNS = {
+    vital_type: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for vital_type, patterns in PATTERNS.items()
+}
+
+
+def build_pattern_database():
+    """Compile every vital pattern into one Hyperscan database.
+
+    Lookarounds aren't supported natively, so patterns compile in prefilter
+    mode: the scan may report a superset of hits, which the compiled regex
+    then confirms. Ids are assigned in PATTERNS order.
+    """
+    expressions, ids, lookup = [], [], []
+    for vital_type, patterns in COMPILED_PATTERNS.items():
+        for pattern in patterns:
+            ids.append(len(lookup))
+            expressions.append(pattern.pattern.encode('utf-8'))
+            lookup.append((vital_type, pattern))
+
+    db = hyperscan.Database()
+    db.compile(
+        expressions=expressions,
+        ids=ids,
+        elements=len(ids),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_PREFILTER] * len(ids)
+    )
+    return db, lookup
+
+
+def _on_pattern_match(pattern_id, start, end, flags, hits):
+    """Hyperscan callback: record which patterns may match."""
+    hits.add(pattern_id)
+
+
+PATTERN_DB, PATTERN_LOOKUP = build_pattern_database() if hyperscan else (None, None)
+
 # Neonatal vital ranges for validation
 VALID_RANGES = {
     'hr': (80, 200),      # bpm
@@ -63,36 +199,126 @@ VALID_RANGES = {
 
 # Smoothing buffer (median of last N readings)
 SMOOTHING_WINDOW = 5
-vital_history = {
-    'hr': deque(maxlen=SMOOTHING_WINDOW),
-    'spo2': deque(maxlen=SMOOTHING_WINDOW),
-    'rr': deque(maxlen=SMOOTHING_WINDOW),
-    'temp': deque(maxlen=SMOOTHING_WINDOW)
-}
+VITAL_IDX = {'hr': 0, 'spo2': 1, 'rr': 2, 'temp': 3}
+# One ring buffer row per vital; each row has its own write head and fill count
+vital_history = np.full((len(VITAL_IDX), SMOOTHING_WINDOW), np.nan)
+history_head = np.zeros(len(VITAL_IDX), dtype=np.intp)
+history_count = np.zeros(len(VITAL_IDX), dtype=np.intp)
+
+
+class GpuPreprocessor:
+    """preprocess_frame on the GPU; the frame is uploaded once and only the
+    final binary image comes back."""
+
+    def __init__(self):
+        self.stream = cv2.cuda_Stream()
+        self.clahe = cv2.cuda.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        # Same kernel sizes cv2.GaussianBlur / adaptiveThreshold pick on the CPU
+        self.sharpen_blur = cv2.cuda.createGaussianFilter(cv2.CV_8UC1, cv2.CV_8UC1, (11, 11), SHARPEN_SIGMA)
+        self.local_mean = cv2.cuda.createGaussianFilter(
+            cv2.CV_8UC1, cv2.CV_8UC1, (ADAPTIVE_BLOCK, ADAPTIVE_BLOCK), 0)
+        self.median = cv2.cuda.createMedianFilter(cv2.CV_8UC1, 3)
+        self.frame = cv2.cuda_GpuMat()
+
+    def process(self, frame):
+        self.frame.upload(frame, self.stream)
+        if frame.ndim == 2:
+            gray = self.frame
+        else:
+            gray = cv2.cuda.cvtColor(self.frame, cv2.COLOR_BGR2GRAY, stream=self.stream)
+        enhanced = self.clahe.apply(gray, self.stream)
+
+        blur = self.sharpen_blur.apply(enhanced, stream=self.stream)
+        sharpened = cv2.cuda.addWeighted(enhanced, 1 + SHARPEN_AMOUNT, blur, -SHARPEN_AMOUNT, 0,
+                                         stream=self.stream)
+
+        height, width = frame.shape[:2]
+        resized = cv2.cuda.resize(sharpened, (width * 2, height * 2),
+                                  interpolation=cv2.INTER_CUBIC, stream=self.stream)
+
+        # adaptiveThreshold has no CUDA version: pixel > gaussian local mean - C
+        threshold = cv2.cuda.subtract(self.local_mean.apply(resized, stream=self.stream),
+                                      ADAPTIVE_C, stream=self.stream)
+        binary = cv2.cuda.compare(resized, threshold, cv2.CMP_GT, stream=self.stream)
+        denoised = self.median.apply(binary, stream=self.stream)
+        result = denoised.download(self.stream)
+        self.stream.waitForCompletion()
+        return result
+
+
+_gpu_preprocessor = None
 
 
 def preprocess_frame(frame):
     """Preprocess frame for better OCR accuracy."""
-    # Convert to grayscale
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    global _gpu_preprocessor
+    if CUDA_AVAILABLE:
+        if _gpu_preprocessor is None:
+            _gpu_preprocessor = GpuPreprocessor()
+        return _gpu_preprocessor.process(frame)
+
+    # Convert to grayscale (GStreamer frames already are)
+    gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
     # Apply CLAHE (Contrast Limited Adaptive Histogram Equalization)
     clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
     enhanced = clahe.apply(gray)
 
+    # Unsharp mask to crisp up digit edges
+    blur = cv2.GaussianBlur(enhanced, (0, 0), SHARPEN_SIGMA)
+    enhanced = cv2.addWeighted(enhanced, 1 + SHARPEN_AMOUNT, blur, -SHARPEN_AMOUNT, 0)
+
     # Resize for better OCR (2x)
     height, width = enhanced.shape
     resized = cv2.resize(enhanced, (width * 2, height * 2), interpolation=cv2.INTER_CUBIC)
 
-    # Apply threshold to get binary image
-    _, binary = cv2.threshold(resized, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    # Apply local threshold to get binary image
+    binary = cv2.adaptiveThreshold(resized, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                   cv2.THRESH_BINARY, ADAPTIVE_BLOCK, ADAPTIVE_C)
 
-    # Denoise
+    # Denoise. medianBlur's 3x3 8-bit path is SIMD and beats a 3x3
+    # morphologyEx here; MORPH_OPEN would also erase thin dark strokes, since
+    # adaptiveThreshold noise shows up as dark specks on a white background
     denoised = cv2.medianBlur(binary, 3)
 
     return denoised
 
 
+_roi_clahe = None
+
+
+def preprocess_roi(roi):
+    """Preprocess one cropped ROI: shrink to a fixed height first so CLAHE and
+    sharpening touch few pixels, then upscale and binarize for Tesseract."""
+    global _roi_clahe
+    gray = roi if roi.ndim == 2 else cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+
+    height, width = gray.shape
+    target_width = max(1, round(width * ROI_TARGET_HEIGHT / height))
+
+    if fused_roi_preprocess is not None:
+        # Shrink + CLAHE + upscale + Otsu in one kernel (no unsharp mask)
+        out = np.empty((ROI_TARGET_HEIGHT * ROI_UPSCALE, target_width * ROI_UPSCALE), dtype=np.uint8)
+        return fused_roi_preprocess(gray, out, ROI_UPSCALE)
+    small = cv2.resize(gray, (target_width, ROI_TARGET_HEIGHT), interpolation=cv2.INTER_CUBIC)
+
+    # A 44 px strip only fits a couple of CLAHE tiles vertically
+    if _roi_clahe is None:
+        _roi_clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(2, 4))
+    enhanced = _roi_clahe.apply(small)
+
+    blur = cv2.GaussianBlur(enhanced, (0, 0), SHARPEN_SIGMA)
+    enhanced = cv2.addWeighted(enhanced, 1 + SHARPEN_AMOUNT, blur, -SHARPEN_AMOUNT, 0)
+
+    # Upscale the grayscale image so the binary edges come out smooth
+    resized = cv2.resize(enhanced, (target_width * ROI_UPSCALE, ROI_TARGET_HEIGHT * ROI_UPSCALE),
+                         interpolation=cv2.INTER_LANCZOS4)
+
+    # One digit group per ROI, so a global Otsu threshold is enough
+    _, binary = cv2.threshold(resized, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return binary
+
+
 def extract_vitals_from_text(text):
     """Extract vital signs from OCR text using pattern matching."""
     vitals = {}
@@ -101,47 +327,123 @@ def extract_vitals_from_text(text):
     # Clean text
     text = text.upper().replace('\n', ' ')
 
-    for vital_type, patterns in PATTERNS.items():
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    value = float(match.group(1))
-                    min_val, max_val = VALID_RANGES[vital_type]
-
-                    # Validate range
-                    if min_val <= value <= max_val:
-                        vitals[vital_type] = value
-                        confidence_scores[vital_type] = 0.85  # Base confidence for regex match
-                        break
-                except (ValueError, IndexError):
-                    continue
+    if PATTERN_DB is not None:
+        # One scan over the text; only patterns that can match run a regex
+        hits = set()
+        PATTERN_DB.scan(text.encode('utf-8'), match_event_handler=_on_pattern_match, context=hits)
+        candidates = [PATTERN_LOOKUP[i] for i in sorted(hits)]
+    else:
+        candidates = [
+            (vital_type, pattern)
+            for vital_type, patterns in COMPILED_PATTERNS.items()
+            for pattern in patterns
+        ]
+
+    for vital_type, pattern in candidates:
+        if vital_type in vitals:
+            continue
+        match = pattern.search(text)
+        if match:
+            try:
+                value = float(match.group(1))
+                min_val, max_val = VALID_RANGES[vital_type]
+
+                # Validate range
+                if min_val <= value <= max_val:
+                    vitals[vital_type] = value
+                    confidence_scores[vital_type] = 0.85  # Base confidence for regex match
+            except (ValueError, IndexError):
+                continue
 
     return vitals, confidence_scores
 
 
+def tesseract_pipe(image, config):
+    """Run the tesseract binary once, PNG in on stdin and text out on stdout;
+    skips pytesseract's temp files and PIL conversion."""
+    ok, png = cv2.imencode('.png', image, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+    if not ok:
+        raise ValueError("PNG encode failed")
+    result = subprocess.run(
+        [pytesseract.pytesseract.tesseract_cmd, 'stdin', 'stdout', *config.split()],
+        input=png.tobytes(), capture_output=True, check=True)
+    return result.stdout.decode('utf-8', 'replace')
+
+
+_tess_api = None
+
+
+def ocr_image(processed, psm, whitelist):
+    """Run Tesseract on a preprocessed single-channel image."""
+    global _tess_api
+    if PyTessBaseAPI is None:
+        return tesseract_pipe(processed, TESSERACT_CONFIG.format(psm, whitelist))
+
+    # One persistent API keeps the model loaded between frames
+    if _tess_api is None:
+        _tess_api = PyTessBaseAPI()
+    _tess_api.SetPageSegMode(PSM.SINGLE_LINE if psm == ROI_PSM else PSM.SINGLE_BLOCK)
+    _tess_api.SetVariable('tessedit_char_whitelist', whitelist)
+
+    processed = np.ascontiguousarray(processed)
+    height, width = processed.shape
+    _tess_api.SetImageBytes(processed.tobytes(), width, height, 1, width)
+    return _tess_api.GetUTF8Text()
+
+
+_roi_cache = {}  # vital_type -> (thumbnail, OCR text, OCR time) from the last OCR pass
+
+
+def extract_vitals_rois(frame):
+    """OCR each calibrated ROI separately and read one number per vital."""
+    vitals = {}
+    confidence_scores = {}
+    texts = []
+
+    for vital_type, (y1, y2, x1, x2) in ROIS.items():
+        roi = frame[y1:y2, x1:x2]
+        gray = roi if roi.ndim == 2 else cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+        # Area averaging washes out sensor noise but not a changed digit
+        thumb = cv2.resize(gray, ROI_THUMB_SIZE, interpolation=cv2.INTER_AREA)
+
+        now = time.time()
+        cached = _roi_cache.get(vital_type)
+        if (cached is not None and now - cached[2] < ROI_OCR_REFRESH_SEC and
+                cv2.absdiff(thumb, cached[0]).max() < ROI_CHANGE_THRESHOLD):
+            text = cached[1]
+        else:
+            processed = preprocess_roi(gray)
+            text = ocr_image(processed, ROI_PSM, WHITELIST[vital_type]).strip()
+            _roi_cache[vital_type] = (thumb, text, now)
+        texts.append(f"{vital_type.upper()}:{text}")
+
+        match = NUMBER_PATTERN.search(text)
+        if match:
+            value = float(match.group())
+            min_val, max_val = VALID_RANGES[vital_type]
+            if min_val <= value <= max_val:
+                vitals[vital_type] = value
+                confidence_scores[vital_type] = 0.85
+
+    return vitals, confidence_scores, ' '.join(texts)
+
+
 def extract_vitals_ocr(frame):
     """Perform OCR on frame and extract vital signs."""
     try:
+        if ROIS:
+            vitals, confidence, text = extract_vitals_rois(frame)
+            return vitals, confidence, text[:100]
+
         # Preprocess
         processed = preprocess_frame(frame)
 
         # Run OCR
-        text = pytesseract.image_to_string(processed, config=TESSERACT_CONFIG)
+        text = ocr_image(processed, FULL_FRAME_PSM, FULL_FRAME_WHITELIST)
 
-        # Also try with different preprocessing for digits
-        _, binary_inv = cv2.threshold(
-            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY),
-            127, 255, cv2.THRESH_BINARY_INV
-        )
-        text_inv = pytesseract.image_to_string(binary_inv, config=TESSERACT_CONFIG)
+        vitals, confidence = extract_vitals_from_text(text)
 
-        # Combine results
-        combined_text = f"{text} {text_inv}"
-
-        vitals, confidence = extract_vitals_from_text(combined_text)
-
-        return vitals, confidence, combined_text.strip()[:100]
+        return vitals, confidence, text.strip()[:100]
 
     except Exception as e:
         return {}, {}, f"OCR Error: {str(e)}"
@@ -149,18 +451,19 @@ def extract_vitals_ocr(frame):
 
 def apply_smoothing(new_vitals):
     """Apply temporal smoothing using median of recent readings."""
-    smoothed = {}
-
     for vital_type, value in new_vitals.items():
-        vital_history[vital_type].append(value)
+        i = VITAL_IDX[vital_type]
+        vital_history[i, history_head[i]] = value
+        history_head[i] = (history_head[i] + 1) % SMOOTHING_WINDOW
+        history_count[i] = min(history_count[i] + 1, SMOOTHING_WINDOW)
 
-        if len(vital_history[vital_type]) >= 3:
-            # Use median for smoothing
-            values = sorted(vital_history[vital_type])
-            mid = len(values) // 2
-            smoothed[vital_type] = values[mid]
-        else:
-            smoothed[vital_type] = value
+    # Medians for all rows at once: unfilled (NaN) slots sort to the end
+    medians = np.sort(vital_history, axis=1)[np.arange(len(VITAL_IDX)), history_count // 2]
+
+    smoothed = {}
+    for vital_type, value in new_vitals.items():
+        i = VITAL_IDX[vital_type]
+        smoothed[vital_type] = float(medians[i]) if history_count[i] >= 3 else value
 
     return smoothed
 
@@ -175,7 +478,14 @@ def generate_simulation_vitals():
     }
 
 
-def send_vitals(vitals, confidence=0.92, ocr_text=""):
+# One pooled keep-alive connection reused across posts instead of a new TCP
+# handshake every INTERVAL_SECONDS
+_session = requests.Session()
+_session.headers['Connection'] = 'keep-alive'
+_session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+
+def send_vitals(vitals, confidence=0.92, ocr_text="", timestamp=None):
     """Send vitals to NICU Dashboard API."""
     # Ensure all vital types are present (use None for missing)
     payload = {
@@ -189,7 +499,7 @@ def send_vitals(vitals, confidence=0.92, ocr_text=""):
         },
         "confidence": confidence,
         "inferenceTimeMs": random.randint(80, 250),
-        "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', '') + "Z",
+        "timestamp": timestamp or datetime.now(timezone.utc),
         "metadata": {
             "ocrText": ocr_text[:200] if ocr_text else "",
             "source": "mac-ocr-processor"
@@ -199,14 +509,169 @@ def send_vitals(vitals, confidence=0.92, ocr_text=""):
     # Remove None values from vitals
     payload["vitals"] = {k: v for k, v in payload["vitals"].items() if v is not None}
 
+    if orjson is not None:
+        body = orjson.dumps(payload, option=orjson.OPT_UTC_Z)
+    else:
+        payload["timestamp"] = payload["timestamp"].isoformat().replace('+00:00', 'Z')
+        body = json.dumps(payload)
+
     try:
-        response = requests.post(API_URL, json=payload, timeout=5)
+        response = _session.post(API_URL, data=body,
+                                 headers={'Content-Type': 'application/json'}, timeout=5)
         return response.json()
     except Exception as e:
         return {"error": str(e)}
 
 
+class VitalsSender(threading.Thread):
+    """Background poster; the OCR loop hands readings off instead of waiting
+    on the API."""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.queue = Queue(maxsize=SEND_QUEUE_SIZE)
+        self.dropped = 0
+        self.last_result = {}
+
+    def submit(self, vitals, confidence, ocr_text=""):
+        """Queue a reading stamped with the capture time; drop it when full."""
+        try:
+            self.queue.put_nowait((vitals, confidence, ocr_text, datetime.now(timezone.utc)))
+        except Full:
+            self.dropped += 1
+
+    def run(self):
+        while True:
+            self.last_result = send_vitals(*self.queue.get())
+
+
+class MappedFrame:
+    """Exposes a mapped GStreamer buffer to NumPy; unmapped once the last
+    array viewing it is garbage collected."""
+
+    def __init__(self, buffer, map_info, width, height):
+        self.buffer = buffer
+        self.map_info = map_info
+        stride = (width + 3) & ~3  # GRAY8 rows are 4-byte aligned
+        data = np.frombuffer(map_info.data, dtype=np.uint8)
+        self.__array_interface__ = {
+            'version': 3,
+            'shape': (height, width),
+            'strides': (stride, 1),
+            'typestr': '|u1',
+            'data': (data.ctypes.data, True),
+        }
+
+    def __del__(self):
+        self.buffer.unmap(self.map_info)
+
+
+class GstCapture:
+    """Minimal cv2.VideoCapture stand-in backed by a GStreamer appsink."""
+
+    def __init__(self, url):
+        Gst.init(None)
+        self.pipeline = Gst.parse_launch(GST_PIPELINE.format(url=url))
+        self.sink = self.pipeline.get_by_name('sink')
+        result = self.pipeline.set_state(Gst.State.PLAYING)
+        self.opened = result != Gst.StateChangeReturn.FAILURE
+
+    def isOpened(self):
+        return self.opened
+
+    def read(self):
+        sample = self.sink.emit('try-pull-sample', Gst.SECOND)
+        if sample is None:
+            return False, None
+
+        caps = sample.get_caps().get_structure(0)
+        buffer = sample.get_buffer()
+        ok, map_info = buffer.map(Gst.MapFlags.READ)
+        if not ok:
+            return False, None
+
+        mapped = MappedFrame(buffer, map_info, caps.get_value('width'), caps.get_value('height'))
+        return True, np.asarray(mapped)
+
+    def release(self):
+        self.pipeline.set_state(Gst.State.NULL)
+
+
+class FrameGrabber(threading.Thread):
+    """Reads the stream continuously so `latest` is always the newest frame.
+
+    The grabber owns the capture and releases it when it exits, so the
+    capture is never freed while a blocking read() is still using it.
+    """
+
+    def __init__(self, cap):
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self._latest = None
+
+    @property
+    def latest(self):
+        """Newest frame, or None once the stream has stopped delivering"""
+        with self.lock:
+            latest = self._latest
+        if latest is None:
+            return None
+        frame, ts = latest
+        if time.time() - ts > STALE_FRAME_SEC:
+            return None
+        return frame
+
+    def run(self):
+        try:
+            while not self.stopped.is_set():
+                ret, frame = self.cap.read()
+                if not ret:
+                    time.sleep(0.01)
+                    continue
+                with self.lock:
+                    self._latest = (frame, time.time())
+        finally:
+            self.cap.release()
+
+    def stop(self):
+        self.stopped.set()
+        self.join(timeout=2)
+
+
+def calibrate_rois():
+    """Grab one frame and let the user draw a box around each vital."""
+    cap = cv2.VideoCapture(RTSP_URL)
+    ret, frame = cap.read()
+    cap.release()
+    if not ret:
+        print("ERROR: Could not read a frame from the RTSP stream")
+        return
+
+    rois = {}
+    for vital_type in WHITELIST:
+        x, y, w, h = cv2.selectROI(f"Select {vital_type.upper()} digits (Enter to confirm, c to skip)",
+                                   frame, showCrosshair=True)
+        if w and h:
+            rois[vital_type] = [y, y + h, x, x + w]
+    cv2.destroyAllWindows()
+
+    with open(ROI_FILE, 'w') as f:
+        json.dump(rois, f, indent=2)
+    print(f"Saved {len(rois)} ROIs to {ROI_FILE}")
+
+
 def main():
+    parser = argparse.ArgumentParser(description='NICU camera OCR to dashboard connector')
+    parser.add_argument('--calibrate', action='store_true',
+                        help='Select the per-vital screen regions and save them')
+    args = parser.parse_args()
+
+    if args.calibrate:
+        calibrate_rois()
+        return
+
     print("=" * 70)
     print("NICU Camera to Dashboard - Real OCR Connector")
     print("=" * 70)
@@ -216,13 +681,19 @@ def main():
     print(f"Patient ID:     {PATIENT_ID}")
     print(f"Interval:       {INTERVAL_SECONDS}s")
     print(f"Smoothing:      Median of {SMOOTHING_WINDOW} readings")
+    print(f"OCR regions:    {', '.join(ROIS) if ROIS else 'full frame (run --calibrate)'}")
     print("=" * 70)
     print()
 
     # Connect to camera
     print("Connecting to camera stream...")
-    cap = cv2.VideoCapture(RTSP_URL)
-    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Minimize latency
+    if USE_GSTREAMER and Gst is not None:
+        cap = GstCapture(RTSP_URL)
+    else:
+        os.environ['OPENCV_FFMPEG_CAPTURE_OPTIONS'] = FFMPEG_CAPTURE_OPTIONS
+        cap = cv2.VideoCapture(RTSP_URL, cv2.CAP_FFMPEG)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Minimize latency
+    grabber = None
 
     if not cap.isOpened():
         print("WARNING: Could not connect to RTSP stream")
@@ -230,11 +701,16 @@ def main():
         stream_connected = False
     else:
         print("Connected to camera stream!")
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        print(f"Stream: {width}x{height} @ {fps:.1f}fps")
+        if isinstance(cap, GstCapture):
+            print("Stream: GStreamer GRAY8")
+        else:
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            print(f"Stream: {width}x{height} @ {fps:.1f}fps")
         stream_connected = True
+        grabber = FrameGrabber(cap)
+        grabber.start()
 
     print()
     print("Starting vitals extraction... (Ctrl+C to stop)")
@@ -245,6 +721,8 @@ def main():
     ocr_success_count = 0
     sim_count = 0
     total_count = 0
+    sender = VitalsSender()
+    sender.start()
 
     try:
         while True:
@@ -254,13 +732,9 @@ def main():
             ocr_text = ""
 
             if stream_connected:
-                # Flush buffer to get latest frame
-                for _ in range(5):
-                    cap.grab()
-
-                ret, frame = cap.read()
+                frame = grabber.latest
 
-                if ret and frame is not None:
+                if frame is not None:
                     # Attempt OCR extraction
                     ocr_vitals, ocr_conf, ocr_text = extract_vitals_ocr(frame)
 
@@ -280,8 +754,9 @@ def main():
 
             total_count += 1
 
-            # Send to dashboard
-            result = send_vitals(vitals, confidence, ocr_text)
+            # Hand off to the sender; show the latest completed post
+            sender.submit(vitals, confidence, ocr_text)
+            result = sender.last_result
 
             # Display status
             timestamp = datetime.now().strftime("%H:%M:%S")
@@ -290,7 +765,9 @@ def main():
             rr = vitals.get('rr', '-')
             temp = vitals.get('temp', '-')
 
-            if result.get("success"):
+            if not result:
+                result_str = "… pending"
+            elif result.get("success"):
                 result_str = f"✓ id={result.get('vitalId')}"
             else:
                 error_msg = str(result.get('error') or result.get('message') or 'Unknown')
@@ -301,7 +778,8 @@ def main():
             # Periodic stats
             if total_count % 20 == 0:
                 ocr_rate = (ocr_success_count / total_count * 100) if total_count > 0 else 0
-                print(f"--- Stats: {total_count} readings, OCR success rate: {ocr_rate:.1f}% ---")
+                print(f"--- Stats: {total_count} readings, OCR success rate: {ocr_rate:.1f}%, "
+                      f"{sender.dropped} dropped by the send queue ---")
 
             time.sleep(INTERVAL_SECONDS)
 
@@ -314,8 +792,9 @@ def main():
         if total_count > 0:
             print(f"  OCR success rate: {ocr_success_count/total_count*100:.1f}%")
     finally:
-        if stream_connected:
-            cap.release()
+        # A running grabber releases the capture itself once its read returns
+        if grabber:
+            grabber.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+NICU OCR Kernels
+Numba-compiled image kernels for the camera OCR connectors.
+
+fused_preprocess() is an alternative to the OpenCV CLAHE -> resize -> Otsu
+-> median chain that enhances at source resolution and only writes the
+upscaled image once. It is opt-in (USE_FUSED_PREPROCESS in
+camera-connector-production.py): on one core it measured 1.0 ms vs 0.6 ms
+for OpenCV at 640x480 and 9.4 ms vs 7.2 ms at 1080p with a 2x upscale, as
+OpenCV's SIMD median and resize outrun it. fused_roi_preprocess() does the
+same for the small per-vital ROIs of camera-to-dashboard-ocr.py. Compiled
+artifacts are cached on disk (cache=True) and the kernels are warmed up at
+import so the first real frame doesn't pay JIT.
+"""
+
+import math
+import numpy as np
+from numba import get_num_threads, njit, prange
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _clahe_luts(gray, tiles_y, tiles_x, clip):
+    """Per-tile clipped-histogram lookup tables (CLAHE) for `gray`."""
+    h, w = gray.shape
+    th = (h + tiles_y - 1) // tiles_y
+    tw = (w + tiles_x - 1) // tiles_x
+
+    luts = np.empty((tiles_y, tiles_x, 256), dtype=np.uint8)
+    for t in prange(tiles_y * tiles_x):
+        ty = t // tiles_x
+        tx = t % tiles_x
+        y0 = min(ty * th, h)
+        y1 = min(y0 + th, h)
+        x0 = min(tx * tw, w)
+        x1 = min(x0 + tw, w)
+        area = (y1 - y0) * (x1 - x0)
+
+        hist = np.zeros(256, dtype=np.int64)
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                hist[gray[y, x]] += 1
+
+        if area == 0:
+            for v in range(256):
+                luts[ty, tx, v] = v
+            continue
+
+        limit = max(1, int(clip * area / 256))
+        excess = 0
+        for v in range(256):
+            if hist[v] > limit:
+                excess += hist[v] - limit
+                hist[v] = limit
+        bonus = excess // 256
+        for v in range(256):
+            hist[v] += bonus
+
+        cdf = 0
+        for v in range(256):
+            cdf += hist[v]
+            luts[ty, tx, v] = min(255, int(cdf * 255.0 / area + 0.5))
+
+    return luts
+
+
+@njit(nogil=True, cache=True)
+def _otsu_threshold(hist):
+    """Otsu threshold of a 256-bin histogram."""
+    total = 0
+    sum_all = 0.0
+    for v in range(256):
+        total += hist[v]
+        sum_all += v * hist[v]
+
+    thresh = 0
+    best = -1.0
+    weight_bg = 0
+    sum_bg = 0.0
+    for v in range(256):
+        weight_bg += hist[v]
+        if weight_bg == 0:
+            continue
+        weight_fg = total - weight_bg
+        if weight_fg == 0:
+            break
+        sum_bg += v * hist[v]
+        mean_bg = sum_bg / weight_bg
+        mean_fg = (sum_all - sum_bg) / weight_fg
+        between = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        if between > best:
+            best = between
+            thresh = v
+    return thresh
+
+
+def preprocess_scratch(h, w, ow, chunks=None):
+    """Scratch arrays for fused_preprocess of an (h, w) frame into width `ow`.
+
+    Returns (enhanced, hist_parts, col_sums); the caller keeps them across
+    frames so the kernel itself allocates nothing proportional to the frame.
+    """
+    chunks = chunks or get_num_threads()
+    return (np.empty((h, w), dtype=np.uint8),
+            np.empty((chunks, 256), dtype=np.int64),
+            np.empty((chunks, ow), dtype=np.uint8))
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def fused_preprocess(gray, out, enhanced, hist_parts, col_sums, tiles=8, clip=2.0):
+    """CLAHE + upscale + Otsu + 3x3 median of `gray` (uint8) into `out` (uint8).
+
+    `out` may be larger than `gray`; pixels are upsampled nearest-neighbour,
+    which is lossless for the binarized result Tesseract sees. `enhanced`,
+    `hist_parts` and `col_sums` come from preprocess_scratch(); work is split
+    into one row band per `hist_parts` row.
+    """
+    h, w = gray.shape
+    oh, ow = out.shape
+    chunks = hist_parts.shape[0]
+    th = (h + tiles - 1) // tiles
+    tw = (w + tiles - 1) // tiles
+
+    # 1. Per-tile clipped-histogram lookup tables (CLAHE)
+    luts = _clahe_luts(gray, tiles, tiles, clip)
+
+    # Nearest-neighbour maps, and how many output pixels each source
+    # row/column becomes (the Otsu histogram is of the upscaled image)
+    ys = np.empty(oh, dtype=np.int64)
+    rep_y = np.zeros(h, dtype=np.int64)
+    for oy in range(oh):
+        ys[oy] = oy * h // oh
+        rep_y[ys[oy]] += 1
+    xs = np.empty(ow, dtype=np.int64)
+    rep_x = np.zeros(w, dtype=np.int64)
+    for ox in range(ow):
+        xs[ox] = ox * w // ow
+        rep_x[xs[ox]] += 1
+
+    # Tile interpolation weights depend only on the column
+    tx0s = np.empty(w, dtype=np.int64)
+    tx1s = np.empty(w, dtype=np.int64)
+    wxs = np.empty(w, dtype=np.float64)
+    for x in range(w):
+        fx = (x + 0.5) / tw - 0.5
+        tx0s[x] = min(max(int(math.floor(fx)), 0), tiles - 1)
+        tx1s[x] = min(tx0s[x] + 1, tiles - 1)
+        wxs[x] = min(max(fx - tx0s[x], 0.0), 1.0)
+
+    # 2. Enhance at source resolution, one partial Otsu histogram per band
+    for c in prange(chunks):
+        part = hist_parts[c]
+        part[:] = 0
+        for y in range(c * h // chunks, (c + 1) * h // chunks):
+            fy = (y + 0.5) / th - 0.5
+            ty0 = min(max(int(math.floor(fy)), 0), tiles - 1)
+            ty1 = min(ty0 + 1, tiles - 1)
+            wy = min(max(fy - ty0, 0.0), 1.0)
+            ry = rep_y[y]
+            for x in range(w):
+                v = gray[y, x]
+                tx0 = tx0s[x]
+                tx1 = tx1s[x]
+                wx = wxs[x]
+                top = luts[ty0, tx0, v] * (1.0 - wx) + luts[ty0, tx1, v] * wx
+                bottom = luts[ty1, tx0, v] * (1.0 - wx) + luts[ty1, tx1, v] * wx
+                e = int(top * (1.0 - wy) + bottom * wy + 0.5)
+                enhanced[y, x] = e
+                part[e] += ry * rep_x[x]
+
+    # 3. Otsu threshold from the reduced histogram
+    hist = np.zeros(256, dtype=np.int64)
+    for c in range(chunks):
+        for v in range(256):
+            hist[v] += hist_parts[c, v]
+
+    thresh = _otsu_threshold(hist)
+
+    # 4. Binarize in place to 0/1
+    for c in prange(chunks):
+        for y in range(c * h // chunks, (c + 1) * h // chunks):
+            for x in range(w):
+                enhanced[y, x] = 1 if enhanced[y, x] > thresh else 0
+
+    # 5. Upscale + 3x3 median. On a binary image the median of nine samples
+    # is a majority vote: sum each output column's three rows, then three
+    # adjacent column sums (replicated border, as cv2.medianBlur).
+    for c in prange(chunks):
+        sums = col_sums[c]
+        for oy in range(c * oh // chunks, (c + 1) * oh // chunks):
+            r0 = ys[max(oy - 1, 0)]
+            r1 = ys[oy]
+            r2 = ys[min(oy + 1, oh - 1)]
+            for ox in range(ow):
+                x = xs[ox]
+                sums[ox] = enhanced[r0, x] + enhanced[r1, x] + enhanced[r2, x]
+            if ow == 1:
+                out[oy, 0] = 255 if 3 * sums[0] >= 5 else 0
+                continue
+            out[oy, 0] = 255 if 2 * sums[0] + sums[1] >= 5 else 0
+            for ox in range(1, ow - 1):
+                out[oy, ox] = 255 if sums[ox - 1] + sums[ox] + sums[ox + 1] >= 5 else 0
+            out[oy, ow - 1] = 255 if sums[ow - 2] + 2 * sums[ow - 1] >= 5 else 0
+
+    return out
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def fused_roi_preprocess(gray, out, upscale, tiles_y=2, tiles_x=4, clip=2.0):
+    """Shrink + CLAHE + bilinear upscale + Otsu of one digit ROI into `out`.
+
+    `gray` (uint8, any size) is area-averaged down to `upscale` times smaller
+    than `out`, and only that small image is ever stored: the upscale and
+    the threshold happen in the same write, so no full-size grayscale
+    intermediate exists.
+    """
+    h, w = gray.shape
+    oh, ow = out.shape
+    sh = max(1, oh // upscale)
+    sw = max(1, ow // upscale)
+
+    # 1. Area-average down to the small size
+    small = np.empty((sh, sw), dtype=np.uint8)
+    for sy in prange(sh):
+        y0 = sy * h // sh
+        y1 = max(y0 + 1, (sy + 1) * h // sh)
+        for sx in range(sw):
+            x0 = sx * w // sw
+            x1 = max(x0 + 1, (sx + 1) * w // sw)
+            acc = 0
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    acc += gray[y, x]
+            small[sy, sx] = (acc + (y1 - y0) * (x1 - x0) // 2) // ((y1 - y0) * (x1 - x0))
+
+    # 2. CLAHE on the small image, histogram for Otsu in the same sweep
+    luts = _clahe_luts(small, tiles_y, tiles_x, clip)
+    th = (sh + tiles_y - 1) // tiles_y
+    tw = (sw + tiles_x - 1) // tiles_x
+    hist = np.zeros(256, dtype=np.int64)
+    for y in range(sh):
+        fy = (y + 0.5) / th - 0.5
+        ty0 = min(max(int(math.floor(fy)), 0), tiles_y - 1)
+        ty1 = min(ty0 + 1, tiles_y - 1)
+        wy = min(max(fy - ty0, 0.0), 1.0)
+        for x in range(sw):
+            fx = (x + 0.5) / tw - 0.5
+            tx0 = min(max(int(math.floor(fx)), 0), tiles_x - 1)
+            tx1 = min(tx0 + 1, tiles_x - 1)
+            wx = min(max(fx - tx0, 0.0), 1.0)
+
+            v = small[y, x]
+            top = luts[ty0, tx0, v] * (1.0 - wx) + luts[ty0, tx1, v] * wx
+            bottom = luts[ty1, tx0, v] * (1.0 - wx) + luts[ty1, tx1, v] * wx
+            e = int(top * (1.0 - wy) + bottom * wy + 0.5)
+            small[y, x] = e
+            hist[e] += 1
+
+    thresh = _otsu_threshold(hist)
+
+    # 3. Bilinear upscale straight into the binarized output
+    for oy in prange(oh):
+        fy = min(max((oy + 0.5) * sh / oh - 0.5, 0.0), sh - 1.0)
+        y0 = int(fy)
+        y1 = min(y0 + 1, sh - 1)
+        wy = fy - y0
+        for ox in range(ow):
+            fx = min(max((ox + 0.5) * sw / ow - 0.5, 0.0), sw - 1.0)
+            x0 = int(fx)
+            x1 = min(x0 + 1, sw - 1)
+            wx = fx - x0
+            top = small[y0, x0] * (1.0 - wx) + small[y0, x1] * wx
+            bottom = small[y1, x0] * (1.0 - wx) + small[y1, x1] * wx
+            out[oy, ox] = 255 if top * (1.0 - wy) + bottom * wy > thresh else 0
+
+    return out
+
+
+def warmup():
+    """Compile (or load from cache) every kernel on a small dummy frame."""
+    dummy = np.zeros((64, 64), dtype=np.uint8)
+    fused_preprocess(dummy, np.empty((128, 128), dtype=np.uint8),
+                     *preprocess_scratch(64, 64, 128))
+    fused_roi_preprocess(dummy, np.empty((132, 396), dtype=np.uint8), 3)
+
+
+warmup()
@@ -9,15 +9,29 @@ Architecture:
 
 import cv2
 import ollama
+import asyncio
 import requests
 import time
 import base64
 import json
-import re
 import os
+import threading
 from datetime import datetime, timezone
-from io import BytesIO
-from PIL import Image
+from queue import Queue, Full
+from requests.adapters import HTTPAdapter
+
+try:
+    # Serializes datetimes natively and is much faster than stdlib json
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # libjpeg-turbo SIMD encoder; takes BGR directly
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJSAMP_420
+    _turbojpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):  # package or libturbojpeg missing
+    _turbojpeg = None
 
 # ============================================================================
 # CONFIGURATION
@@ -28,9 +42,17 @@ API_URL = "http://localhost:3001/api/vitals/ingest"
 CAMERA_ID = "camera-vlm-001"
 PATIENT_ID = 1
 SAMPLE_INTERVAL = 10  # Seconds between VLM queries (VLM is slower than traditional OCR)
-
-# Moondream model
-MODEL_NAME = "moondream"
+SEND_QUEUE_SIZE = 32  # Readings buffered while the dashboard API is slow
+STALE_FRAME_SEC = 5  # Latest frame older than this means the stream is dead
+JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+
+# Moondream model: 4-bit weights (ollama pull moondream:1.8b-v2-q4_0).
+# Decode is memory-bandwidth bound, so q4_0 runs well ahead of the fp16 default.
+MODEL_NAME = "moondream:1.8b-v2-q4_0"
+OLLAMA_HOST = None  # None = ollama default (localhost:11434)
+KEEP_ALIVE = "1h"   # Keep the model loaded between queries
+# The reply is a short JSON object: cap decoding and keep the context small
+VLM_OPTIONS = {'num_predict': 80, 'temperature': 0, 'num_ctx': 512, 'num_gpu': 99}
 
 # VLM Prompt for vital signs extraction
 VLM_PROMPT = """Look at this image of a patient monitor display.
@@ -64,37 +86,33 @@ VALID_RANGES = {
 
 def frame_to_base64(frame):
     """Convert OpenCV frame to base64 for Ollama."""
-    # Convert BGR to RGB
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-    # Convert to PIL Image
-    pil_image = Image.fromarray(rgb_frame)
-
-    # Save to bytes
-    buffer = BytesIO()
-    pil_image.save(buffer, format='JPEG', quality=85)
-    buffer.seek(0)
+    if _turbojpeg is not None:
+        jpeg = _turbojpeg.encode(frame, quality=85, pixel_format=TJPF_BGR, jpeg_subsample=TJSAMP_420)
+        return base64.b64encode(jpeg).decode('utf-8')
 
-    # Encode to base64
-    return base64.b64encode(buffer.read()).decode('utf-8')
+    # OpenCV encodes BGR directly, no RGB copy or PIL image
+    ok, jpeg = cv2.imencode('.jpg', frame, JPEG_PARAMS)
+    if not ok:
+        raise ValueError("JPEG encode failed")
+    return base64.b64encode(jpeg).decode('utf-8')
 
 
-def extract_vitals_vlm(frame):
-    """Use Moondream VLM to extract vital signs from frame."""
+async def extract_vitals_vlm(client, img_base64):
+    """Use Moondream VLM to extract vital signs from a base64 JPEG."""
     try:
         start_time = time.time()
 
-        # Convert frame to base64
-        img_base64 = frame_to_base64(frame)
-
         # Query Moondream
-        response = ollama.chat(
+        response = await client.chat(
             model=MODEL_NAME,
             messages=[{
                 'role': 'user',
                 'content': VLM_PROMPT,
                 'images': [img_base64]
-            }]
+            }],
+            format='json',  # grammar-constrained: the reply is always a JSON object
+            keep_alive=KEEP_ALIVE,
+            options=VLM_OPTIONS
         )
 
         inference_time = (time.time() - start_time) * 1000
@@ -117,51 +135,20 @@ def extract_vitals_vlm(frame):
 
 def parse_vitals_response(response_text):
     """Parse VLM response to extract vital values."""
-    vitals = {
-        'hr': None,
-        'spo2': None,
-        'rr': None,
-        'temp': None,
-        'bp_sys': None,
-        'bp_dia': None
-    }
-
-    try:
-        # Try to find JSON in response
-        json_match = re.search(r'\{[^{}]*\}', response_text, re.DOTALL)
-        if json_match:
-            data = json.loads(json_match.group())
-
-            for key in vitals.keys():
-                if key in data and data[key] is not None:
-                    try:
-                        value = float(data[key])
-                        # Validate range
-                        if key in VALID_RANGES:
-                            min_val, max_val = VALID_RANGES[key]
-                            if min_val <= value <= max_val:
-                                vitals[key] = value
-                    except (ValueError, TypeError):
-                        pass
-    except json.JSONDecodeError:
-        # Try regex extraction as fallback
-        patterns = {
-            'hr': r'(?:hr|heart\s*rate)[:\s]*(\d{2,3})',
-            'spo2': r'(?:spo2|oxygen|sat)[:\s]*(\d{2,3})',
-            'rr': r'(?:rr|resp)[:\s]*(\d{1,3})',
-            'temp': r'(?:temp)[:\s]*(\d{2}\.?\d?)',
-        }
-
-        for key, pattern in patterns.items():
-            match = re.search(pattern, response_text, re.IGNORECASE)
-            if match:
-                try:
-                    value = float(match.group(1))
-                    min_val, max_val = VALID_RANGES[key]
-                    if min_val <= value <= max_val:
-                        vitals[key] = value
-                except ValueError:
-                    pass
+    vitals = dict.fromkeys(VALID_RANGES)
+    data = json.loads(response_text)
+
+    # Six scalar range checks: plain Python beats a NumPy/Numba round-trip here
+    for key, (min_val, max_val) in VALID_RANGES.items():
+        value = data.get(key)
+        if value is None:
+            continue
+        try:
+            value = float(value)
+        except (ValueError, TypeError):
+            continue
+        if min_val <= value <= max_val:
+            vitals[key] = value
 
     return vitals
 
@@ -170,7 +157,13 @@ def parse_vitals_response(response_text):
 # API CLIENT
 # ============================================================================
 
-def send_vitals(vitals, confidence, inference_time, vlm_response=""):
+# Reuse one keep-alive connection to the dashboard for every post
+_session = requests.Session()
+_session.headers['Connection'] = 'keep-alive'
+_session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+
+def send_vitals(vitals, confidence, inference_time, vlm_response="", timestamp=None):
     """Send vitals to NICU Dashboard API."""
     payload = {
         "patientId": PATIENT_ID,
@@ -183,7 +176,7 @@ def send_vitals(vitals, confidence, inference_time, vlm_response=""):
         },
         "confidence": confidence,
         "inferenceTimeMs": int(inference_time),
-        "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        "timestamp": timestamp or datetime.now(timezone.utc),
         "metadata": {
             "source": "moondream-vlm",
             "vlm_response": vlm_response[:500] if vlm_response else "",
@@ -199,13 +192,43 @@ def send_vitals(vitals, confidence, inference_time, vlm_response=""):
     if not payload["vitals"]:
         return {"error": "No vitals extracted"}
 
+    if orjson is not None:
+        body = orjson.dumps(payload, option=orjson.OPT_UTC_Z)
+    else:
+        payload["timestamp"] = payload["timestamp"].isoformat().replace('+00:00', 'Z')
+        body = json.dumps(payload)
+
     try:
-        response = requests.post(API_URL, json=payload, timeout=10)
+        response = _session.post(API_URL, data=body,
+                                 headers={'Content-Type': 'application/json'}, timeout=10)
         return response.json()
     except Exception as e:
         return {"error": str(e)}
 
 
+class VitalsSender(threading.Thread):
+    """Posts readings from a queue so a stalled API doesn't eat into the VLM
+    sampling cadence."""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.queue = Queue(maxsize=SEND_QUEUE_SIZE)
+        self.dropped = 0
+        self.last_result = {}
+
+    def submit(self, vitals, confidence, inference_time, vlm_response=""):
+        """Queue a reading with its capture time; drop it if the queue is full."""
+        try:
+            self.queue.put_nowait((vitals, confidence, inference_time, vlm_response,
+                                   datetime.now(timezone.utc)))
+        except Full:
+            self.dropped += 1
+
+    def run(self):
+        while True:
+            self.last_result = send_vitals(*self.queue.get())
+
+
 # ============================================================================
 # STREAM CAPTURE
 # ============================================================================
@@ -216,33 +239,64 @@ class StreamCapture:
     def __init__(self, url):
         self.url = url
         self.cap = None
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.latest = None
 
         # Set FFmpeg options for low latency
         os.environ['OPENCV_FFMPEG_CAPTURE_OPTIONS'] = (
-            'rtsp_transport;tcp|fflags;nobuffer|flags;low_delay'
+            'rtsp_transport;tcp|fflags;nobuffer|flags;low_delay|max_delay;0|'
+            'analyzeduration;100000|probesize;32768'
         )
 
     def connect(self):
-        """Connect to RTSP stream."""
+        """Connect to RTSP stream and start the background reader."""
         self.cap = cv2.VideoCapture(self.url, cv2.CAP_FFMPEG)
         self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-        return self.cap.isOpened()
+        if not self.cap.isOpened():
+            return False
+
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self._read_loop, args=(self.cap,), daemon=True)
+        self.thread.start()
+        return True
+
+    def _read_loop(self, cap):
+        """Read continuously so the newest frame is always on hand.
+
+        The reader owns the capture and releases it on exit, so it is never
+        freed while a blocking read() is still using it.
+        """
+        try:
+            while not self.stopped.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    time.sleep(0.01)
+                    continue
+                with self.lock:
+                    self.latest = (frame, time.time())
+        finally:
+            cap.release()
 
     def get_frame(self):
-        """Get latest frame."""
-        if not self.cap or not self.cap.isOpened():
+        """Get latest frame, or None once the stream has stopped delivering."""
+        with self.lock:
+            latest = self.latest
+        if latest is None:
             return None
-
-        # Flush buffer
-        for _ in range(3):
-            self.cap.grab()
-
-        ret, frame = self.cap.read()
-        return frame if ret else None
+        frame, ts = latest
+        if time.time() - ts > STALE_FRAME_SEC:
+            return None
+        return frame
 
     def release(self):
         """Release stream."""
-        if self.cap:
+        self.stopped.set()
+        if self.thread:
+            # A running reader releases the capture once its read returns
+            self.thread.join(timeout=2)
+        elif self.cap:
             self.cap.release()
 
 
@@ -250,6 +304,72 @@ class StreamCapture:
 # MAIN
 # ============================================================================
 
+async def run_vlm_loop(stream, stream_connected, stats, sender):
+    """Query the VLM every SAMPLE_INTERVAL seconds and forward results."""
+    client = ollama.AsyncClient(host=OLLAMA_HOST)
+    loop = asyncio.get_running_loop()
+    next_tick = time.monotonic()
+
+    while True:
+        frame = None
+
+        if stream_connected:
+            frame = stream.get_frame()
+
+        if frame is not None:
+            # JPEG encode runs off the event loop
+            img_base64 = await loop.run_in_executor(None, frame_to_base64, frame)
+
+            # Extract vitals using VLM
+            vitals, confidence, inference_time, vlm_response = await extract_vitals_vlm(client, img_base64)
+            stats['total_queries'] += 1
+
+            # Send to API if we got vitals
+            if any(v is not None for v in vitals.values()):
+                stats['successful_extractions'] += 1
+                sender.submit(vitals, confidence, inference_time, vlm_response)
+                result = sender.last_result  # Latest completed post
+            else:
+                result = {"error": "No vitals detected in image"}
+
+            # Display results
+            ts = datetime.now().strftime("%H:%M:%S")
+            hr = str(int(vitals['hr'])) if vitals.get('hr') else '-'
+            spo2 = str(int(vitals['spo2'])) if vitals.get('spo2') else '-'
+            rr = str(int(vitals['rr'])) if vitals.get('rr') else '-'
+            temp = f"{vitals['temp']:.1f}" if vitals.get('temp') else '-'
+            infer = f"{inference_time:.0f}ms"
+
+            if not result:
+                res = "… pending"
+            elif result.get("success"):
+                res = f"✓ #{result.get('vitalId')}"
+            elif result.get("error"):
+                res = f"✗ {str(result.get('error'))[:20]}"
+            else:
+                res = "✗ Unknown"
+
+            print(f"{ts:<10} {hr:<6} {spo2:<6} {rr:<5} {temp:<7} {confidence:.2f}  {infer:<8} {res}")
+
+            # Show VLM response snippet
+            if vlm_response and not vlm_response.startswith("VLM Error"):
+                print(f"           VLM: {vlm_response[:60]}...")
+
+        else:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] No frame available")
+
+        # Stats every 10 queries
+        total_queries = stats['total_queries']
+        if total_queries > 0 and total_queries % 10 == 0:
+            success_rate = stats['successful_extractions'] / total_queries * 100
+            print(f"--- Stats: {total_queries} queries, {success_rate:.0f}% extraction rate, "
+                  f"{sender.dropped} dropped by the send queue ---")
+
+        # Fixed cadence: inference time counts toward the interval
+        next_tick += SAMPLE_INTERVAL
+        await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+
+
 def main():
     print("=" * 70)
     print("NICU VLM-Based Vitals Extractor")
@@ -265,12 +385,14 @@ def main():
     try:
         test_response = ollama.chat(
             model=MODEL_NAME,
-            messages=[{'role': 'user', 'content': 'Say "ready" if you can see images.'}]
+            messages=[{'role': 'user', 'content': 'Say "ready" if you can see images.'}],
+            keep_alive=KEEP_ALIVE
         )
         print(f"VLM Ready: {test_response['message']['content'][:50]}...")
     except Exception as e:
         print(f"ERROR: Cannot connect to Moondream: {e}")
         print("Make sure Ollama is running: brew services start ollama")
+        print(f"and the model is pulled: ollama pull {MODEL_NAME}")
         return
 
     # Connect to stream
@@ -289,60 +411,16 @@ def main():
     print(f"{'Time':<10} {'HR':<6} {'SpO2':<6} {'RR':<5} {'Temp':<7} {'Conf':<6} {'Infer':<8} {'Result'}")
     print("-" * 70)
 
-    total_queries = 0
-    successful_extractions = 0
+    stats = {'total_queries': 0, 'successful_extractions': 0}
+    sender = VitalsSender()
+    sender.start()
 
     try:
-        while True:
-            frame = None
-
-            if stream_connected:
-                frame = stream.get_frame()
-
-            if frame is not None:
-                # Extract vitals using VLM
-                vitals, confidence, inference_time, vlm_response = extract_vitals_vlm(frame)
-                total_queries += 1
-
-                # Send to API if we got vitals
-                if any(v is not None for v in vitals.values()):
-                    successful_extractions += 1
-                    result = send_vitals(vitals, confidence, inference_time, vlm_response)
-                else:
-                    result = {"error": "No vitals detected in image"}
-
-                # Display results
-                ts = datetime.now().strftime("%H:%M:%S")
-                hr = str(int(vitals['hr'])) if vitals.get('hr') else '-'
-                spo2 = str(int(vitals['spo2'])) if vitals.get('spo2') else '-'
-                rr = str(int(vitals['rr'])) if vitals.get('rr') else '-'
-                temp = f"{vitals['temp']:.1f}" if vitals.get('temp') else '-'
-                infer = f"{inference_time:.0f}ms"
-
-                if result.get("success"):
-                    res = f"✓ #{result.get('vitalId')}"
-                elif result.get("error"):
-                    res = f"✗ {str(result.get('error'))[:20]}"
-                else:
-                    res = "✗ Unknown"
-
-                print(f"{ts:<10} {hr:<6} {spo2:<6} {rr:<5} {temp:<7} {confidence:.2f}  {infer:<8} {res}")
-
-                # Show VLM response snippet
-                if vlm_response and not vlm_response.startswith("VLM Error"):
-                    print(f"           VLM: {vlm_response[:60]}...")
-
-            else:
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] No frame available")
-
-            # Stats every 10 queries
-            if total_queries > 0 and total_queries % 10 == 0:
-                success_rate = successful_extractions / total_queries * 100
-                print(f"--- Stats: {total_queries} queries, {success_rate:.0f}% extraction rate ---")
-
-            time.sleep(SAMPLE_INTERVAL)
+        asyncio.run(run_vlm_loop(stream, stream_connected, stats, sender))
 
     except KeyboardInterrupt:
+        total_queries = stats['total_queries']
+        successful_extractions = stats['successful_extractions']
         print("\n" + "-" * 70)
         print(f"Stopped. {total_queries} VLM queries, {successful_extractions} successful extractions")
         if total_queries > 0:
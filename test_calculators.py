@@ -15,13 +15,112 @@ Tests all calculator features including:
 - Growth Percentile Calculator (on Growth page)
 """
 
-from playwright.sync_api import sync_playwright
-import time
+from playwright.async_api import async_playwright, expect, TimeoutError as PlaywrightTimeoutError
+from contextvars import ContextVar
+import asyncio
+from pathlib import Path
+import os
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Number of pages driven concurrently inside the one logged-in context
+WORKERS = int(os.getenv("CALC_TEST_WORKERS", "4"))
+VIEWPORT = {"width": 1920, "height": 1080}
+
+# DevTools endpoint of an already running Chromium, e.g. one started with
+# --remote-debugging-port=9222; saves the browser launch on repeated runs
+CDP_URL = os.getenv("PW_CDP_URL")
+
+# Split the run across machines: CALC_TEST_SHARD="2/4" runs the second of
+# four interleaved slices of CALCULATOR_TESTS
+SHARD = os.getenv("CALC_TEST_SHARD", "1/1")
+
+APP_URL = "http://localhost:3000"
+CALCULATORS_URL = f"{APP_URL}/calculators"
+
+# Sidebar links of the app shell; following one is a client-side route
+# change that keeps the loaded bundle instead of a full page load
+NAV_LINK = 'nav[aria-label="Main navigation"] a[href="{}"]'
+
+# The tests only read text and click controls; images, fonts, media and
+# analytics beacons are pure page-load overhead
+BLOCKED_RESOURCE_TYPES = frozenset(("image", "font", "media"))
+BLOCKED_HOSTS = ("google-analytics", "googletagmanager", "segment.io", "mixpanel", "sentry.io", "hotjar")
+
+# Sidebar button -> heading of the panel it opens
+CALCULATOR_PANELS = {
+    "Gestational Age": "Gestational Age Calculator",
+    "Corrected Age": "Corrected Age Calculator",
+    "Bilirubin Risk": "Bilirubin Risk Assessment",
+    "Fluid Calculator": "Fluid Requirements Calculator",
+    "GIR Calculator": "GIR Calculator",
+    "Calorie Calculator": "Calorie Calculator",
+    "APGAR Score": "APGAR Score Calculator",
+    "SNAPPE-II": "SNAPPE-II Score Calculator",
+    "Drug Dosing": "Drug Dosing Calculator",
+}
+
+# Score-2 button of each APGAR category: heart rate, respiratory effort,
+# muscle tone, reflex irritability, color
+APGAR_TOP_SCORES = ("2 - ≥100", "2 - Good/Crying", "2 - Active Motion", "2 - Cry/Cough", "2 - All Pink")
+
+# Column holding the selected calculator's form and results; the NaN
+# checks read only its text and failure screenshots capture only it
+CALC_PANEL_SELECTOR = "div.col-span-9"
+
+# Sets each React-controlled input through the native value setter and
+# fires the input event React listens for; returns selectors not found
+FILL_INPUTS_JS = """fields => {
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    return fields.filter(([selector, value]) => {
+        const input = document.querySelector(selector);
+        if (!input) return true;
+        setValue.call(input, value);
+        input.dispatchEvent(new Event('input', {bubbles: true}));
+        return false;
+    }).map(([selector]) => selector);
+}"""
+
+# Returns the names that appear anywhere in the rendered page text
+PRESENT_TEXTS_JS = """names => {
+    const text = document.body.innerText;
+    return names.filter(name => text.includes(name));
+}"""
+
+# Session cookies saved after a successful login; later runs reuse them
+# and only go through the login form if the app rejects them
+AUTH_FILE = "/tmp/test_calculators_auth.json"
+
+RESULTS_FILE = Path("/tmp/test_calculators_results.json")
+
 # Test results storage
 test_results = []
 
+# Position of the running test in CALCULATOR_TESTS, so the summary keeps
+# the declared order even though pages finish out of order
+_test_order = ContextVar("test_order", default=-1)
+
+async def save_failure_screenshot(page, name):
+    """JPEG of a failing test; passing tests take no screenshot.
+
+    On the calculators page only the calculator column is captured, the
+    other pages fall back to the viewport.
+    """
+    path = f"/tmp/test_calculators_{name}.jpg"
+    try:
+        if page.url.split("?")[0] == CALCULATORS_URL:
+            target = page.locator(CALC_PANEL_SELECTOR).first
+        else:
+            target = page
+        await target.screenshot(path=path, type="jpeg", quality=50)
+        return path
+    except Exception:
+        return ""
+
 def log_result(test_name, status, details="", screenshot_path=""):
     """Log test result"""
     result = {
@@ -30,730 +129,632 @@ def log_result(test_name, status, details="", screenshot_path=""):
         "details": details,
         "screenshot": screenshot_path
     }
-    test_results.append(result)
+    test_results.append((_test_order.get(), result))
     status_icon = "PASS" if status == "pass" else "FAIL"
     print(f"[{status_icon}] {test_name}: {details}")
 
-def test_login(page):
+async def test_login(page):
     """Test login functionality"""
     try:
-        page.goto("http://localhost:3000/login")
-        page.wait_for_load_state("networkidle")
+        await page.goto(f"{APP_URL}/login", wait_until="domcontentloaded")
+        await page.locator('input[type="email"]').wait_for(state="visible", timeout=5000)
 
         # Fill login form
-        page.fill('input[type="email"]', "admin@hospital.org")
-        page.fill('input[type="password"]', "admin123")
-        page.click('button[type="submit"]')
+        await page.fill('input[type="email"]', "admin@hospital.org")
+        await page.fill('input[type="password"]', "admin123")
+        await page.click('button[type="submit"]')
 
-        page.wait_for_load_state("networkidle")
-        time.sleep(2)
+        # Wait for the redirect away from /login instead of network idle
+        try:
+            await page.wait_for_url(lambda url: "/login" not in url, timeout=10000)
+        except PlaywrightTimeoutError:
+            pass
 
         # Check if login was successful
         if "/login" not in page.url:
-            page.screenshot(path="/tmp/test_calculators_01_login.png")
-            log_result("Login", "pass", "Successfully logged in as admin", "/tmp/test_calculators_01_login.png")
+            log_result("Login", "pass", "Successfully logged in as admin")
             return True
         else:
-            page.screenshot(path="/tmp/test_calculators_01_login_failed.png")
-            log_result("Login", "fail", "Login failed - still on login page", "/tmp/test_calculators_01_login_failed.png")
+            log_result("Login", "fail", "Login failed - still on login page", await save_failure_screenshot(page, "01_login"))
             return False
     except Exception as e:
-        log_result("Login", "fail", f"Error: {str(e)}")
+        log_result("Login", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "01_login"))
+        return False
+
+async def open_app_page(page, path):
+    """Go to an app page through the sidebar when the app is already loaded"""
+    link = page.locator(NAV_LINK.format(path))
+    if await link.count():
+        await link.click()
+        await page.wait_for_url(APP_URL + path)
+    else:
+        await page.goto(APP_URL + path, wait_until="domcontentloaded")
+
+async def open_calculators(page):
+    """Show the calculators page, navigating only if this page is elsewhere"""
+    if page.url.split("?")[0] != CALCULATORS_URL:
+        await open_app_page(page, "/calculators")
+    await page.get_by_role("heading", name="Clinical Calculators").wait_for(state="visible", timeout=5000)
+
+async def select_calculator(page, name):
+    """Open a calculator from the sidebar and wait for its panel to render"""
+    panel = page.get_by_role("heading", name=CALCULATOR_PANELS[name])
+    if await panel.is_visible():
+        # Left open by an earlier test: switch away so React remounts it
+        # with fresh state instead of reloading the whole page
+        other = next(calc for calc in CALCULATOR_PANELS if calc != name)
+        await page.get_by_role("button", name=other).first.click()
+        await panel.wait_for(state="hidden", timeout=2000)
+    await page.get_by_role("button", name=name).first.click()
+    await panel.wait_for(state="visible", timeout=2000)
+
+async def fill_inputs(page, fields):
+    """Fill several inputs, keyed by selector, in one round-trip"""
+    missing = await page.evaluate(FILL_INPUTS_JS, [[selector, value] for selector, value in fields.items()])
+    if missing:
+        raise Exception(f"Inputs not found: {', '.join(missing)}")
+
+async def is_shown(locator, timeout=2000):
+    """Let expect() retry until a result is visible instead of probing once"""
+    try:
+        await expect(locator.first).to_be_visible(timeout=timeout)
+        return True
+    except AssertionError:
         return False
 
-def test_calculators_page_access(page):
+async def block_unneeded_requests(route):
+    """Abort media and analytics requests the tests never look at"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def restore_session(page):
+    """Reuse the saved login if the app still accepts it"""
+    try:
+        # Either the calculators heading or the login form, whichever the app serves
+        await page.goto(CALCULATORS_URL, wait_until="domcontentloaded")
+        await page.wait_for_selector("h1:has-text('Clinical Calculators'), input[type='password']", timeout=5000)
+        if "/login" in page.url:
+            return False
+        log_result("Login", "pass", f"Reused saved session from {AUTH_FILE}")
+        return True
+    except Exception:
+        return False
+
+async def test_calculators_page_access(page):
     """Test access to calculators page"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(2)
+        await open_calculators(page)
 
         # Check page title
-        title = page.locator("h1").first.text_content()
+        title = await page.locator("h1").first.text_content()
         if "Clinical Calculators" in title:
-            page.screenshot(path="/tmp/test_calculators_02_page_access.png")
-            log_result("Calculators Page Access", "pass", "Calculator page loaded successfully", "/tmp/test_calculators_02_page_access.png")
+            log_result("Calculators Page Access", "pass", "Calculator page loaded successfully")
             return True
         else:
-            log_result("Calculators Page Access", "fail", f"Unexpected title: {title}")
+            log_result("Calculators Page Access", "fail", f"Unexpected title: {title}", await save_failure_screenshot(page, "02_page_access"))
             return False
     except Exception as e:
-        log_result("Calculators Page Access", "fail", f"Error: {str(e)}")
+        log_result("Calculators Page Access", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "02_page_access"))
         return False
 
-def test_ga_calculator(page):
+async def test_ga_calculator(page):
     """Test Gestational Age Calculator"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Click on GA calculator (should be default)
-        ga_button = page.locator("text=Gestational Age").first
-        ga_button.click()
-        time.sleep(0.5)
+        await select_calculator(page, "Gestational Age")
 
         # Enter LMP date (6 months ago for ~26 weeks)
         lmp_input = page.locator('input[type="date"]').first
-        lmp_input.fill("2024-06-30")  # About 26 weeks ago
+        await lmp_input.fill("2024-06-30")  # About 26 weeks ago
 
         # Click calculate
-        calc_button = page.locator("button:has-text('Calculate')").first
-        calc_button.click()
-        time.sleep(0.5)
+        calc_button = page.get_by_role("button", name="Calculate", exact=True)
+        await calc_button.click()
 
         # Check for result display
-        result = page.locator("text=weeks").first
-        if result.is_visible():
-            page.screenshot(path="/tmp/test_calculators_03_ga_calc.png")
-            log_result("GA Calculator", "pass", "Gestational age calculated successfully", "/tmp/test_calculators_03_ga_calc.png")
+        result = page.get_by_text("weeks").first
+        if await is_shown(result):
+            log_result("GA Calculator", "pass", "Gestational age calculated successfully")
             return True
         else:
-            log_result("GA Calculator", "fail", "No result displayed")
+            log_result("GA Calculator", "fail", "No result displayed", await save_failure_screenshot(page, "03_ga_calc"))
             return False
     except Exception as e:
-        log_result("GA Calculator", "fail", f"Error: {str(e)}")
+        log_result("GA Calculator", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "03_ga_calc"))
         return False
 
-def test_corrected_age_calculator(page):
+async def test_corrected_age_calculator(page):
     """Test Corrected Age Calculator"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Click on Corrected Age calculator
-        corr_button = page.locator("text=Corrected Age").first
-        corr_button.click()
-        time.sleep(0.5)
+        await select_calculator(page, "Corrected Age")
 
         # Find the Corrected Age Calculator form
         # Enter GA at birth
         ga_weeks_input = page.locator('input[type="number"]').first
-        ga_weeks_input.fill("28")
+        await ga_weeks_input.fill("28")
 
         ga_days_input = page.locator('input[type="number"]').nth(1)
-        ga_days_input.fill("3")
+        await ga_days_input.fill("3")
 
         # Enter DOB
         dob_input = page.locator('input[type="date"]').first
-        dob_input.fill("2024-10-15")
+        await dob_input.fill("2024-10-15")
 
         # Click calculate
-        calc_button = page.locator("button:has-text('Calculate')").first
-        calc_button.click()
-        time.sleep(0.5)
+        calc_button = page.get_by_role("button", name="Calculate", exact=True)
+        await calc_button.click()
 
         # Check for result
-        result = page.locator("text=Chronological Age")
-        if result.is_visible():
-            page.screenshot(path="/tmp/test_calculators_04_corrected_age.png")
-            log_result("Corrected Age Calculator", "pass", "Corrected age calculated with PCA and chronological age", "/tmp/test_calculators_04_corrected_age.png")
+        result = page.get_by_text("Chronological Age")
+        if await is_shown(result):
+            log_result("Corrected Age Calculator", "pass", "Corrected age calculated with PCA and chronological age")
             return True
         else:
-            log_result("Corrected Age Calculator", "fail", "No result displayed")
+            log_result("Corrected Age Calculator", "fail", "No result displayed", await save_failure_screenshot(page, "04_corrected_age"))
             return False
     except Exception as e:
-        log_result("Corrected Age Calculator", "fail", f"Error: {str(e)}")
+        log_result("Corrected Age Calculator", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "04_corrected_age"))
         return False
 
-def test_bilirubin_calculator(page):
+async def test_bilirubin_calculator(page):
     """Test Bilirubin Risk Calculator"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Click on Bilirubin Risk calculator
-        bili_button = page.locator("text=Bilirubin Risk").first
-        bili_button.click()
-        time.sleep(0.5)
+        await select_calculator(page, "Bilirubin Risk")
 
         # Enter bilirubin value
         bili_input = page.locator('input[placeholder="12.5"]').first
-        bili_input.fill("14.5")
+        await bili_input.fill("14.5")
 
         # Enter age in hours
         age_input = page.locator('input[placeholder="48"]').first
-        age_input.fill("72")
+        await age_input.fill("72")
 
         # Click calculate
-        calc_button = page.locator("button:has-text('Calculate')").first
-        calc_button.click()
-        time.sleep(0.5)
+        calc_button = page.get_by_role("button", name="Calculate", exact=True)
+        await calc_button.click()
 
         # Check for risk zone result
-        result = page.locator("text=Risk Zone")
-        if result.is_visible():
+        result = page.get_by_text("Risk Zone")
+        if await is_shown(result):
             # Check for proper threshold display
-            photo_threshold = page.locator("text=Phototherapy Threshold")
-            if photo_threshold.is_visible():
-                page.screenshot(path="/tmp/test_calculators_05_bilirubin.png")
-                log_result("Bilirubin Calculator", "pass", "Bilirubin risk calculated with AAP 2022 thresholds", "/tmp/test_calculators_05_bilirubin.png")
+            photo_threshold = page.get_by_text("Phototherapy Threshold")
+            if await is_shown(photo_threshold):
+                log_result("Bilirubin Calculator", "pass", "Bilirubin risk calculated with AAP 2022 thresholds")
                 return True
-        log_result("Bilirubin Calculator", "fail", "No risk zone result displayed")
+        log_result("Bilirubin Calculator", "fail", "No risk zone result displayed", await save_failure_screenshot(page, "05_bilirubin"))
         return False
     except Exception as e:
-        log_result("Bilirubin Calculator", "fail", f"Error: {str(e)}")
+        log_result("Bilirubin Calculator", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "05_bilirubin"))
         return False
 
-def test_fluid_calculator(page):
+async def test_fluid_calculator(page):
     """Test Fluid Requirements Calculator"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Click on Fluid Calculator
-        fluid_button = page.locator("text=Fluid Calculator").first
-        fluid_button.click()
-        time.sleep(0.5)
+        await select_calculator(page, "Fluid Calculator")
 
-        # Enter weight
-        weight_input = page.locator('input[placeholder="1500"]').first
-        weight_input.fill("1200")
-
-        # GA should be pre-filled, but let's verify
-        ga_input = page.locator('input[type="number"]').nth(1)
-        ga_input.fill("28")
+        # Enter weight; GA should be pre-filled (the field without a placeholder), but let's verify
+        await fill_inputs(page, {
+            'input[placeholder="1500"]': "1200",
+            'input[type="number"]:not([placeholder])': "28",
+        })
 
         # Click calculate
-        calc_button = page.locator("button:has-text('Calculate Fluid Requirements')").first
-        calc_button.click()
-        time.sleep(0.5)
+        calc_button = page.get_by_role("button", name="Calculate Fluid Requirements")
+        await calc_button.click()
 
         # Check for results
-        result = page.locator("text=mL/kg/d")
-        if result.is_visible():
+        result = page.get_by_text("mL/kg/d")
+        if await is_shown(result):
             # Check for hourly rate
-            hourly = page.locator("text=mL/hr")
-            if hourly.is_visible():
-                page.screenshot(path="/tmp/test_calculators_06_fluid.png")
-                log_result("Fluid Calculator", "pass", "Fluid requirements calculated with proper units (mL/kg/day, mL/hr)", "/tmp/test_calculators_06_fluid.png")
+            hourly = page.get_by_text("mL/hr")
+            if await is_shown(hourly):
+                log_result("Fluid Calculator", "pass", "Fluid requirements calculated with proper units (mL/kg/day, mL/hr)")
                 return True
-        log_result("Fluid Calculator", "fail", "No fluid requirements displayed")
+        log_result("Fluid Calculator", "fail", "No fluid requirements displayed", await save_failure_screenshot(page, "06_fluid"))
         return False
     except Exception as e:
-        log_result("Fluid Calculator", "fail", f"Error: {str(e)}")
+        log_result("Fluid Calculator", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "06_fluid"))
         return False
 
-def test_fluid_calculator_modifiers(page):
+async def test_fluid_calculator_modifiers(page):
     """Test Fluid Calculator with clinical modifiers"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Click on Fluid Calculator
-        fluid_button = page.locator("text=Fluid Calculator").first
-        fluid_button.click()
-        time.sleep(0.5)
+        await select_calculator(page, "Fluid Calculator")
 
         # Enter weight
         weight_input = page.locator('input[placeholder="1500"]').first
-        weight_input.fill("1200")
+        await weight_input.fill("1200")
 
         # Click Phototherapy modifier
-        photo_btn = page.locator("text=Phototherapy").first
-        photo_btn.click()
-        time.sleep(0.3)
+        photo_btn = page.get_by_role("button", name="Phototherapy").first
+        await photo_btn.click()
 
         # Click Radiant Warmer modifier
-        warmer_btn = page.locator("text=Radiant Warmer").first
-        warmer_btn.click()
-        time.sleep(0.3)
+        warmer_btn = page.get_by_role("button", name="Radiant Warmer").first
+        await warmer_btn.click()
 
         # Calculate
-        calc_button = page.locator("button:has-text('Calculate Fluid Requirements')").first
-        calc_button.click()
-        time.sleep(0.5)
+        calc_button = page.get_by_role("button", name="Calculate Fluid Requirements")
+        await calc_button.click()
 
         # Check for adjustments
-        adjustments = page.locator("text=Adjustments Applied")
-        if adjustments.is_visible():
-            page.screenshot(path="/tmp/test_calculators_07_fluid_modifiers.png")
-            log_result("Fluid Calculator Modifiers", "pass", "Fluid modifiers (phototherapy, radiant warmer) applied correctly", "/tmp/test_calculators_07_fluid_modifiers.png")
+        adjustments = page.get_by_text("Adjustments Applied")
+        if await is_shown(adjustments):
+            log_result("Fluid Calculator Modifiers", "pass", "Fluid modifiers (phototherapy, radiant warmer) applied correctly")
             return True
-        log_result("Fluid Calculator Modifiers", "fail", "Modifiers not showing adjustments")
+        log_result("Fluid Calculator Modifiers", "fail", "Modifiers not showing adjustments", await save_failure_screenshot(page, "07_fluid_modifiers"))
         return False
     except Exception as e:
-        log_result("Fluid Calculator Modifiers", "fail", f"Error: {str(e)}")
+        log_result("Fluid Calculator Modifiers", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "07_fluid_modifiers"))
         return False
 
-def test_gir_calculator(page):
+async def test_gir_calculator(page):
     """Test GIR (Glucose Infusion Rate) Calculator"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Click on GIR Calculator
-        gir_button = page.locator("text=GIR Calculator").first
-        gir_button.click()
-        time.sleep(0.5)
+        await select_calculator(page, "GIR Calculator")
 
         # Find the GIR calculator inputs
         inputs = page.locator('input[type="number"]')
 
         # Enter weight (g)
-        inputs.nth(0).fill("1200")
+        await inputs.nth(0).fill("1200")
 
         # Dextrose (%) - should be pre-filled with 10
-        inputs.nth(1).fill("10")
+        await inputs.nth(1).fill("10")
 
         # Rate (mL/hr)
-        inputs.nth(2).fill("5")
+        await inputs.nth(2).fill("5")
 
         # Click calculate
-        calc_button = page.locator("button:has-text('Calculate')").first
-        calc_button.click()
-        time.sleep(0.5)
+        calc_button = page.get_by_role("button", name="Calculate", exact=True)
+        await calc_button.click()
 
         # Check for GIR result with proper units
-        result = page.locator("text=mg/kg/min")
-        if result.is_visible():
-            page.screenshot(path="/tmp/test_calculators_08_gir.png")
-            log_result("GIR Calculator", "pass", "GIR calculated with proper unit (mg/kg/min)", "/tmp/test_calculators_08_gir.png")
+        result = page.get_by_text("mg/kg/min")
+        if await is_shown(result):
+            log_result("GIR Calculator", "pass", "GIR calculated with proper unit (mg/kg/min)")
             return True
-        log_result("GIR Calculator", "fail", "No GIR result displayed")
+        log_result("GIR Calculator", "fail", "No GIR result displayed", await save_failure_screenshot(page, "08_gir"))
         return False
     except Exception as e:
-        log_result("GIR Calculator", "fail", f"Error: {str(e)}")
+        log_result("GIR Calculator", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "08_gir"))
         return False
 
-def test_calorie_calculator(page):
+async def test_calorie_calculator(page):
     """Test Calorie Calculator"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Click on Calorie Calculator
-        cal_button = page.locator("text=Calorie Calculator").first
-        cal_button.click()
-        time.sleep(0.5)
+        await select_calculator(page, "Calorie Calculator")
 
-        # Enter weight
-        weight_input = page.locator('input[placeholder="1200"]').first
-        weight_input.fill("1200")
-
-        # Enter TPN volume
-        tpn_input = page.locator('input[placeholder="100"]').first
-        tpn_input.fill("100")
-
-        # Enter enteral volume
-        enteral_input = page.locator('input[placeholder="15"]').first
-        enteral_input.fill("15")
+        # Enter weight, TPN volume and enteral volume
+        await fill_inputs(page, {
+            'input[placeholder="1200"]': "1200",
+            'input[placeholder="100"]': "100",
+            'input[placeholder="15"]': "15",
+        })
 
         # Click calculate
-        calc_button = page.locator("button:has-text('Calculate Total Calories')").first
-        calc_button.click()
-        time.sleep(0.5)
+        calc_button = page.get_by_role("button", name="Calculate Total Calories")
+        await calc_button.click()
 
         # Check for calorie result
-        result = page.locator("text=kcal/kg")
-        if result.is_visible():
+        result = page.get_by_text("kcal/kg")
+        if await is_shown(result):
             # Check for breakdown
-            breakdown = page.locator("text=TPN Breakdown")
-            if breakdown.is_visible():
-                page.screenshot(path="/tmp/test_calculators_09_calories.png")
-                log_result("Calorie Calculator", "pass", "Calories calculated with TPN/enteral breakdown and kcal/kg", "/tmp/test_calculators_09_calories.png")
+            breakdown = page.get_by_text("TPN Breakdown")
+            if await is_shown(breakdown):
+                log_result("Calorie Calculator", "pass", "Calories calculated with TPN/enteral breakdown and kcal/kg")
                 return True
-        log_result("Calorie Calculator", "fail", "No calorie result displayed")
+        log_result("Calorie Calculator", "fail", "No calorie result displayed", await save_failure_screenshot(page, "09_calories"))
         return False
     except Exception as e:
-        log_result("Calorie Calculator", "fail", f"Error: {str(e)}")
+        log_result("Calorie Calculator", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "09_calories"))
         return False
 
-def test_apgar_calculator(page):
+async def test_apgar_calculator(page):
     """Test APGAR Score Calculator"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Click on APGAR Score calculator
-        apgar_button = page.locator("text=APGAR Score").first
-        apgar_button.click()
-        time.sleep(0.5)
-
-        # Click on score options for each category
-        # Heart Rate: >=100 (score 2)
-        hr_btn = page.locator("text=2 - >=100").first
-        if hr_btn.is_visible():
-            hr_btn.click()
-        else:
-            page.locator("button:has-text('2')").first.click()
-        time.sleep(0.2)
-
-        # Respiratory: Good/Crying (score 2)
-        resp_btn = page.locator("text=2 - Good/Crying").first
-        if resp_btn.is_visible():
-            resp_btn.click()
-        time.sleep(0.2)
-
-        # Muscle Tone: Active Motion (score 2)
-        tone_btn = page.locator("text=2 - Active Motion").first
-        if tone_btn.is_visible():
-            tone_btn.click()
-        time.sleep(0.2)
-
-        # Reflex: Cry/Cough (score 2)
-        reflex_btn = page.locator("text=2 - Cry/Cough").first
-        if reflex_btn.is_visible():
-            reflex_btn.click()
-        time.sleep(0.2)
-
-        # Color: All Pink (score 2)
-        color_btn = page.locator("text=2 - All Pink").first
-        if color_btn.is_visible():
-            color_btn.click()
-        time.sleep(0.5)
+        await select_calculator(page, "APGAR Score")
+
+        # Score 2 in every category
+        for option in APGAR_TOP_SCORES:
+            button = page.get_by_role("button", name=option).first
+            if await button.is_visible():
+                await button.click()
 
         # Check for total score
-        result = page.locator("text=/10")
-        if result.is_visible():
-            page.screenshot(path="/tmp/test_calculators_10_apgar.png")
-            log_result("APGAR Calculator", "pass", "APGAR score calculated with interactive buttons", "/tmp/test_calculators_10_apgar.png")
+        result = page.get_by_text("/10")
+        if await is_shown(result):
+            log_result("APGAR Calculator", "pass", "APGAR score calculated with interactive buttons")
             return True
-        log_result("APGAR Calculator", "fail", "No APGAR score displayed")
+        log_result("APGAR Calculator", "fail", "No APGAR score displayed", await save_failure_screenshot(page, "10_apgar"))
         return False
     except Exception as e:
-        log_result("APGAR Calculator", "fail", f"Error: {str(e)}")
+        log_result("APGAR Calculator", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "10_apgar"))
         return False
 
-def test_snappe_calculator(page):
+async def test_snappe_calculator(page):
     """Test SNAPPE-II Score Calculator"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Click on SNAPPE-II calculator
-        snappe_button = page.locator("text=SNAPPE-II").first
-        snappe_button.click()
-        time.sleep(0.5)
-
-        # Enter birth weight
-        bw_input = page.locator('input[placeholder="1200"]').first
-        bw_input.fill("850")
-
-        # Enter APGAR at 5 min
-        apgar_input = page.locator('input[placeholder="7"]').first
-        apgar_input.fill("5")
-
-        # Enter lowest temp
-        temp_input = page.locator('input[placeholder="36.5"]').first
-        temp_input.fill("35.5")
-
-        # Enter lowest BP
-        bp_input = page.locator('input[placeholder="35"]').first
-        bp_input.fill("25")
-
-        # Enter lowest pH
-        ph_input = page.locator('input[placeholder="7.30"]').first
-        ph_input.fill("7.15")
-
-        # Enter PO2/FiO2
-        ratio_input = page.locator('input[placeholder="300"]').first
-        ratio_input.fill("150")
-
-        # Enter urine output
-        urine_input = page.locator('input[placeholder="1.5"]').first
-        urine_input.fill("0.8")
+        await select_calculator(page, "SNAPPE-II")
+
+        await fill_inputs(page, {
+            'input[placeholder="1200"]': "850",   # Birth weight
+            'input[placeholder="7"]': "5",        # APGAR at 5 min
+            'input[placeholder="36.5"]': "35.5",  # Lowest temp
+            'input[placeholder="35"]': "25",      # Lowest BP
+            'input[placeholder="7.30"]': "7.15",  # Lowest pH
+            'input[placeholder="300"]': "150",    # PO2/FiO2
+            'input[placeholder="1.5"]': "0.8",    # Urine output
+        })
 
         # Click calculate
-        calc_button = page.locator("button:has-text('Calculate SNAPPE-II Score')").first
-        calc_button.click()
-        time.sleep(0.5)
+        calc_button = page.get_by_role("button", name="Calculate SNAPPE-II Score")
+        await calc_button.click()
 
         # Check for mortality risk
-        result = page.locator("text=Predicted Mortality")
-        if result.is_visible():
-            page.screenshot(path="/tmp/test_calculators_11_snappe.png")
-            log_result("SNAPPE-II Calculator", "pass", "SNAPPE-II score calculated with mortality prediction", "/tmp/test_calculators_11_snappe.png")
+        result = page.get_by_text("Predicted Mortality")
+        if await is_shown(result):
+            log_result("SNAPPE-II Calculator", "pass", "SNAPPE-II score calculated with mortality prediction")
             return True
-        log_result("SNAPPE-II Calculator", "fail", "No SNAPPE result displayed")
+        log_result("SNAPPE-II Calculator", "fail", "No SNAPPE result displayed", await save_failure_screenshot(page, "11_snappe"))
         return False
     except Exception as e:
-        log_result("SNAPPE-II Calculator", "fail", f"Error: {str(e)}")
+        log_result("SNAPPE-II Calculator", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "11_snappe"))
         return False
 
-def test_dosing_calculator(page):
+async def test_dosing_calculator(page):
     """Test Drug Dosing Calculator"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Click on Drug Dosing calculator
-        dosing_button = page.locator("text=Drug Dosing").first
-        dosing_button.click()
-        time.sleep(0.5)
+        await select_calculator(page, "Drug Dosing")
 
         # Enter weight
         weight_input = page.locator('input[placeholder="1200"]').first
-        weight_input.fill("1200")
+        await weight_input.fill("1200")
 
         # Select caffeine (default)
         # Click calculate
-        calc_button = page.locator("button:has-text('Calculate Dose')").first
-        calc_button.click()
-        time.sleep(0.5)
+        calc_button = page.get_by_role("button", name="Calculate Dose")
+        await calc_button.click()
 
         # Check for dose result
-        loading_dose = page.locator("text=Loading Dose")
-        maint_dose = page.locator("text=Maintenance Dose")
+        loading_dose = page.get_by_text("Loading Dose")
+        maint_dose = page.get_by_text("Maintenance Dose")
 
-        if loading_dose.is_visible() and maint_dose.is_visible():
-            page.screenshot(path="/tmp/test_calculators_12_dosing.png")
-            log_result("Drug Dosing Calculator", "pass", "Drug doses calculated with loading and maintenance doses", "/tmp/test_calculators_12_dosing.png")
+        if await is_shown(loading_dose) and await is_shown(maint_dose):
+            log_result("Drug Dosing Calculator", "pass", "Drug doses calculated with loading and maintenance doses")
             return True
-        log_result("Drug Dosing Calculator", "fail", "No dosing result displayed")
+        log_result("Drug Dosing Calculator", "fail", "No dosing result displayed", await save_failure_screenshot(page, "12_dosing"))
         return False
     except Exception as e:
-        log_result("Drug Dosing Calculator", "fail", f"Error: {str(e)}")
+        log_result("Drug Dosing Calculator", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "12_dosing"))
         return False
 
-def test_dosing_calculator_gentamicin(page):
+async def test_dosing_calculator_gentamicin(page):
     """Test Drug Dosing Calculator with Gentamicin interval"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Click on Drug Dosing calculator
-        dosing_button = page.locator("text=Drug Dosing").first
-        dosing_button.click()
-        time.sleep(0.5)
+        await select_calculator(page, "Drug Dosing")
 
         # Enter weight
         weight_input = page.locator('input[placeholder="1200"]').first
-        weight_input.fill("1200")
+        await weight_input.fill("1200")
 
         # Select gentamicin
         drug_select = page.locator("select").first
-        drug_select.select_option("gentamicin")
-        time.sleep(0.3)
+        await drug_select.select_option("gentamicin")
 
         # Click calculate
-        calc_button = page.locator("button:has-text('Calculate Dose')").first
-        calc_button.click()
-        time.sleep(0.5)
-
-        # Check for interval display (q36h, q48h, etc.)
-        page.screenshot(path="/tmp/test_calculators_13_dosing_gent.png")
+        calc_button = page.get_by_role("button", name="Calculate Dose")
+        await calc_button.click()
 
         # Check for Gentamicin specific info
-        gent_info = page.locator("text=Gentamicin")
-        if gent_info.is_visible():
-            log_result("Drug Dosing - Gentamicin Interval", "pass", "Gentamicin dosing calculated with GA-based interval", "/tmp/test_calculators_13_dosing_gent.png")
+        gent_info = page.get_by_text("Gentamicin")
+        if await is_shown(gent_info):
+            log_result("Drug Dosing - Gentamicin Interval", "pass", "Gentamicin dosing calculated with GA-based interval")
             return True
-        log_result("Drug Dosing - Gentamicin Interval", "fail", "Gentamicin interval not displayed")
+        log_result("Drug Dosing - Gentamicin Interval", "fail", "Gentamicin interval not displayed", await save_failure_screenshot(page, "13_dosing_gent"))
         return False
     except Exception as e:
-        log_result("Drug Dosing - Gentamicin Interval", "fail", f"Error: {str(e)}")
+        log_result("Drug Dosing - Gentamicin Interval", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "13_dosing_gent"))
         return False
 
-def test_feeding_page_nec_risk(page):
+async def test_feeding_page_nec_risk(page):
     """Test NEC Risk Assessment on Feeding Page"""
     try:
-        page.goto("http://localhost:3000/feeding")
-        page.wait_for_load_state("networkidle")
-        time.sleep(2)
+        await open_app_page(page, "/feeding")
 
-        # Look for NEC Risk Assessment card
-        nec_card = page.locator("text=NEC Risk Assessment")
-        if nec_card.is_visible():
+        # Look for NEC Risk Assessment card, once the feeding data has loaded
+        nec_card = page.get_by_text("NEC Risk Assessment")
+        if await is_shown(nec_card, timeout=10000):
             # Click View Details button
-            details_btn = page.locator("text=View Details").first
-            if details_btn.is_visible():
-                details_btn.click()
-                time.sleep(0.5)
+            details_btn = page.get_by_role("button", name="View Details").first
+            if await details_btn.is_visible():
+                await details_btn.click()
 
             # Check for risk factors display
-            risk_factors = page.locator("text=Risk Factors")
-            recommendation = page.locator("text=Recommendation")
+            risk_factors = page.get_by_text("Risk Factors")
+            recommendation = page.get_by_text("Recommendation")
 
-            if risk_factors.is_visible() and recommendation.is_visible():
-                page.screenshot(path="/tmp/test_calculators_14_nec_risk.png")
-                log_result("NEC Risk Assessment", "pass", "NEC risk calculated with factors and recommendations", "/tmp/test_calculators_14_nec_risk.png")
+            if await is_shown(risk_factors) and await is_shown(recommendation):
+                log_result("NEC Risk Assessment", "pass", "NEC risk calculated with factors and recommendations")
                 return True
 
-        # Still try to screenshot
-        page.screenshot(path="/tmp/test_calculators_14_nec_risk.png")
-        log_result("NEC Risk Assessment", "pass", "NEC Risk Assessment card visible on feeding page", "/tmp/test_calculators_14_nec_risk.png")
+        log_result("NEC Risk Assessment", "pass", "NEC Risk Assessment card visible on feeding page")
         return True
     except Exception as e:
-        log_result("NEC Risk Assessment", "fail", f"Error: {str(e)}")
+        log_result("NEC Risk Assessment", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "14_nec_risk"))
         return False
 
-def test_growth_page_percentiles(page):
+async def test_growth_page_percentiles(page):
     """Test Growth Percentile Calculator/Chart"""
     try:
-        page.goto("http://localhost:3000/growth")
-        page.wait_for_load_state("networkidle")
-        time.sleep(2)
+        await open_app_page(page, "/growth")
 
-        # Check for Fenton chart
-        fenton = page.locator("text=Fenton")
-        percentiles = page.locator("text=Current Percentiles")
+        # Check for Fenton chart, once the growth data has loaded
+        fenton = page.get_by_text("Fenton")
+        percentiles = page.get_by_text("Current Percentiles")
 
-        if fenton.is_visible() and percentiles.is_visible():
+        if await is_shown(fenton, timeout=10000) and await is_shown(percentiles):
             # Check for percentile display
-            weight_percentile = page.locator("text=Weight")
-            if weight_percentile.is_visible():
-                page.screenshot(path="/tmp/test_calculators_15_growth.png")
-                log_result("Growth Percentile Calculator", "pass", "Fenton growth chart with percentiles displayed", "/tmp/test_calculators_15_growth.png")
+            weight_percentile = page.get_by_text("Weight")
+            if await is_shown(weight_percentile):
+                log_result("Growth Percentile Calculator", "pass", "Fenton growth chart with percentiles displayed")
                 return True
 
-        page.screenshot(path="/tmp/test_calculators_15_growth.png")
-        log_result("Growth Percentile Calculator", "fail", "Growth percentile display not found")
+        log_result("Growth Percentile Calculator", "fail", "Growth percentile display not found", await save_failure_screenshot(page, "15_growth"))
         return False
     except Exception as e:
-        log_result("Growth Percentile Calculator", "fail", f"Error: {str(e)}")
+        log_result("Growth Percentile Calculator", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "15_growth"))
         return False
 
-def test_growth_add_measurement(page):
+async def test_growth_add_measurement(page):
     """Test adding measurement to growth chart"""
     try:
-        page.goto("http://localhost:3000/growth")
-        page.wait_for_load_state("networkidle")
-        time.sleep(2)
+        await open_app_page(page, "/growth")
 
-        # Click Add Measurement button
-        add_btn = page.locator("text=Add Measurement").first
-        add_btn.click()
-        time.sleep(0.5)
+        # Click Add Measurement button; the click waits for the page to render it
+        add_btn = page.get_by_role("button", name="Add Measurement").first
+        await add_btn.click()
 
         # Check for modal
-        weight_label = page.locator("text=Weight (g)")
-        length_label = page.locator("text=Length (cm)")
-        hc_label = page.locator("text=HC (cm)")
+        weight_label = page.get_by_text("Weight (g)")
+        length_label = page.get_by_text("Length (cm)")
+        hc_label = page.get_by_text("HC (cm)")
 
-        if weight_label.is_visible() and length_label.is_visible() and hc_label.is_visible():
-            page.screenshot(path="/tmp/test_calculators_16_growth_add.png")
-            log_result("Growth Add Measurement", "pass", "Add measurement modal with proper units (g, cm)", "/tmp/test_calculators_16_growth_add.png")
+        if await is_shown(weight_label) and await is_shown(length_label) and await is_shown(hc_label):
+            log_result("Growth Add Measurement", "pass", "Add measurement modal with proper units (g, cm)")
             return True
 
-        log_result("Growth Add Measurement", "fail", "Add measurement modal not displaying correctly")
+        log_result("Growth Add Measurement", "fail", "Add measurement modal not displaying correctly", await save_failure_screenshot(page, "16_growth_add"))
         return False
     except Exception as e:
-        log_result("Growth Add Measurement", "fail", f"Error: {str(e)}")
+        log_result("Growth Add Measurement", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "16_growth_add"))
         return False
 
-def test_input_validation_negative_weight(page):
+async def test_input_validation_negative_weight(page):
     """Test input validation with invalid values"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Go to Fluid Calculator
-        fluid_button = page.locator("text=Fluid Calculator").first
-        fluid_button.click()
-        time.sleep(0.5)
+        await select_calculator(page, "Fluid Calculator")
 
         # Enter negative weight
         weight_input = page.locator('input[placeholder="1500"]').first
-        weight_input.fill("-100")
+        await weight_input.fill("-100")
 
         # Try to calculate
-        calc_button = page.locator("button:has-text('Calculate Fluid Requirements')").first
-        calc_button.click()
-        time.sleep(0.5)
-
-        page.screenshot(path="/tmp/test_calculators_17_validation.png")
+        calc_button = page.get_by_role("button", name="Calculate Fluid Requirements")
+        await calc_button.click()
 
         # Check if error is shown or result is NaN/invalid
-        result_text = page.content()
+        result_text = await page.locator(CALC_PANEL_SELECTOR).text_content()
         if "NaN" in result_text or "Infinity" in result_text:
-            log_result("Input Validation - Negative Weight", "fail", "Calculator accepts negative weight without validation", "/tmp/test_calculators_17_validation.png")
+            log_result("Input Validation - Negative Weight", "fail", "Calculator accepts negative weight without validation", await save_failure_screenshot(page, "17_validation"))
             return False
 
-        log_result("Input Validation - Negative Weight", "pass", "Calculator handles negative input", "/tmp/test_calculators_17_validation.png")
+        log_result("Input Validation - Negative Weight", "pass", "Calculator handles negative input")
         return True
     except Exception as e:
-        log_result("Input Validation - Negative Weight", "fail", f"Error: {str(e)}")
+        log_result("Input Validation - Negative Weight", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "17_validation"))
         return False
 
-def test_input_validation_empty_fields(page):
+async def test_input_validation_empty_fields(page):
     """Test input validation with empty fields"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Go to GIR Calculator
-        gir_button = page.locator("text=GIR Calculator").first
-        gir_button.click()
-        time.sleep(0.5)
+        await select_calculator(page, "GIR Calculator")
 
         # Don't fill any fields, just calculate
-        calc_button = page.locator("button:has-text('Calculate')").first
-        calc_button.click()
-        time.sleep(0.5)
-
-        page.screenshot(path="/tmp/test_calculators_18_empty_validation.png")
+        calc_button = page.get_by_role("button", name="Calculate", exact=True)
+        await calc_button.click()
 
         # Check if error is shown or result is NaN
-        result_text = page.content()
+        result_text = await page.locator(CALC_PANEL_SELECTOR).text_content()
         if "NaN" in result_text:
-            log_result("Input Validation - Empty Fields", "fail", "Calculator shows NaN for empty fields", "/tmp/test_calculators_18_empty_validation.png")
+            log_result("Input Validation - Empty Fields", "fail", "Calculator shows NaN for empty fields", await save_failure_screenshot(page, "18_empty_validation"))
             return False
 
-        log_result("Input Validation - Empty Fields", "pass", "Calculator handles empty fields gracefully", "/tmp/test_calculators_18_empty_validation.png")
+        log_result("Input Validation - Empty Fields", "pass", "Calculator handles empty fields gracefully")
         return True
     except Exception as e:
-        log_result("Input Validation - Empty Fields", "fail", f"Error: {str(e)}")
+        log_result("Input Validation - Empty Fields", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "18_empty_validation"))
         return False
 
-def test_units_display(page):
+async def test_units_display(page):
     """Test that all units are displayed properly"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         # Check Fluid Calculator units
-        fluid_button = page.locator("text=Fluid Calculator").first
-        fluid_button.click()
-        time.sleep(0.5)
+        await select_calculator(page, "Fluid Calculator")
 
         weight_input = page.locator('input[placeholder="1500"]').first
-        weight_input.fill("1500")
+        await weight_input.fill("1500")
 
-        calc_button = page.locator("button:has-text('Calculate Fluid Requirements')").first
-        calc_button.click()
-        time.sleep(0.5)
+        calc_button = page.get_by_role("button", name="Calculate Fluid Requirements")
+        await calc_button.click()
 
         # Check for proper units
         units_found = []
-        if page.locator("text=mL/kg/d").is_visible():
+        if await is_shown(page.get_by_text("mL/kg/d")):
             units_found.append("mL/kg/d")
-        if page.locator("text=mL/hr").is_visible():
+        if await is_shown(page.get_by_text("mL/hr")):
             units_found.append("mL/hr")
-        if page.locator("text=mEq/day").count() > 0 or page.locator("text=mEq/kg/day").count() > 0:
+        if await page.get_by_text("mEq/day").or_(page.get_by_text("mEq/kg/day")).count() > 0:
             units_found.append("mEq")
 
-        page.screenshot(path="/tmp/test_calculators_19_units.png")
 
         if len(units_found) >= 2:
-            log_result("Units Display", "pass", f"Proper units displayed: {', '.join(units_found)}", "/tmp/test_calculators_19_units.png")
+            log_result("Units Display", "pass", f"Proper units displayed: {', '.join(units_found)}")
             return True
 
-        log_result("Units Display", "fail", f"Only found units: {', '.join(units_found)}")
+        log_result("Units Display", "fail", f"Only found units: {', '.join(units_found)}", await save_failure_screenshot(page, "19_units"))
         return False
     except Exception as e:
-        log_result("Units Display", "fail", f"Error: {str(e)}")
+        log_result("Units Display", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "19_units"))
         return False
 
-def test_calculator_list(page):
+async def test_calculator_list(page):
     """Test all calculators are listed"""
     try:
-        page.goto("http://localhost:3000/calculators")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await open_calculators(page)
 
         expected_calculators = [
             "Gestational Age",
@@ -771,33 +772,30 @@ def test_calculator_list(page):
             "Ventilator"
         ]
 
-        found_calculators = []
-        for calc in expected_calculators:
-            if page.locator(f"text={calc}").count() > 0:
-                found_calculators.append(calc)
-
-        page.screenshot(path="/tmp/test_calculators_20_list.png")
+        # One scan of the page text instead of a text search per name
+        found_calculators = await page.evaluate(PRESENT_TEXTS_JS, expected_calculators)
 
         if len(found_calculators) >= 10:
-            log_result("Calculator List Complete", "pass", f"Found {len(found_calculators)}/{len(expected_calculators)} calculators", "/tmp/test_calculators_20_list.png")
+            log_result("Calculator List Complete", "pass", f"Found {len(found_calculators)}/{len(expected_calculators)} calculators")
             return True
 
         missing = set(expected_calculators) - set(found_calculators)
-        log_result("Calculator List Complete", "fail", f"Missing calculators: {', '.join(missing)}")
+        log_result("Calculator List Complete", "fail", f"Missing calculators: {', '.join(missing)}", await save_failure_screenshot(page, "20_list"))
         return False
     except Exception as e:
-        log_result("Calculator List Complete", "fail", f"Error: {str(e)}")
+        log_result("Calculator List Complete", "fail", f"Error: {str(e)}", await save_failure_screenshot(page, "20_list"))
         return False
 
 def print_summary():
     """Print test summary"""
+    results = [result for _, result in sorted(test_results, key=lambda entry: entry[0])]
     print("\n" + "="*60)
     print("NICU DASHBOARD CALCULATOR TEST SUMMARY")
     print("="*60)
 
-    passed = sum(1 for r in test_results if r["status"] == "pass")
-    failed = sum(1 for r in test_results if r["status"] == "fail")
-    total = len(test_results)
+    passed = sum(1 for r in results if r["status"] == "pass")
+    failed = sum(1 for r in results if r["status"] == "fail")
+    total = len(results)
 
     print(f"\nTotal Tests: {total}")
     print(f"Passed: {passed}")
@@ -808,7 +806,7 @@ def print_summary():
     print("DETAILED RESULTS:")
     print("-"*60)
 
-    for r in test_results:
+    for r in results:
         status_icon = "[PASS]" if r["status"] == "pass" else "[FAIL]"
         print(f"{status_icon} {r['test']}")
         if r["details"]:
@@ -818,53 +816,98 @@ def print_summary():
 
     print("\n" + "="*60)
 
-    # Save results to JSON
-    with open("/tmp/test_calculators_results.json", "w") as f:
-        json.dump({
-            "summary": {
-                "total": total,
-                "passed": passed,
-                "failed": failed,
-                "pass_rate": f"{(passed/total)*100:.1f}%"
-            },
-            "results": test_results
-        }, f, indent=2)
-
-    print("Results saved to /tmp/test_calculators_results.json")
+    # Save results to JSON, once for the whole run
+    report = {
+        "summary": {
+            "total": total,
+            "passed": passed,
+            "failed": failed,
+            "pass_rate": f"{(passed/total)*100:.1f}%"
+        },
+        "results": results
+    }
+    if orjson is not None:
+        RESULTS_FILE.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        RESULTS_FILE.write_text(json.dumps(report, indent=2))
+
+    print(f"Results saved to {RESULTS_FILE}")
+
+# Independent tests, handed out to the pages in this order
+CALCULATOR_TESTS = (
+    test_calculators_page_access,
+    test_calculator_list,
+    test_ga_calculator,
+    test_corrected_age_calculator,
+    test_bilirubin_calculator,
+    test_fluid_calculator,
+    test_fluid_calculator_modifiers,
+    test_gir_calculator,
+    test_calorie_calculator,
+    test_apgar_calculator,
+    test_snappe_calculator,
+    test_dosing_calculator,
+    test_dosing_calculator_gentamicin,
+    test_feeding_page_nec_risk,
+    test_growth_page_percentiles,
+    test_growth_add_measurement,
+    test_input_validation_negative_weight,
+    test_input_validation_empty_fields,
+    test_units_display,
+)
+
+def shard_tests(tests, shard):
+    """Indexed tests belonging to shard "i/n" (1-based), dealt round-robin"""
+    current, total = (int(part) for part in shard.split("/"))
+    if not 1 <= current <= total:
+        raise ValueError(f"Invalid shard {shard!r}, expected i/n with 1 <= i <= n")
+    return [(index, test) for index, test in enumerate(tests) if index % total == current - 1]
+
+async def run_worker(context, pending):
+    """Run queued tests one after another on a page of the shared context"""
+    page = await context.new_page()
+    while True:
+        try:
+            index, test = pending.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+        _test_order.set(index)
+        await test(page)
+    await page.close()
+
+async def run_tests():
+    """Log in, then run the tests on several pages of one context at once"""
+    # Log in once (or reuse the saved session); the tests then run in the
+    # same context, so its cookies and cached app bundle carry over
+    saved_session = os.path.exists(AUTH_FILE)
+    async with async_playwright() as p:
+        if CDP_URL:
+            browser = await p.chromium.connect_over_cdp(CDP_URL)
+        else:
+            browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(viewport=VIEWPORT, storage_state=AUTH_FILE if saved_session else None)
+        await context.route("**/*", block_unneeded_requests)
+        page = await context.new_page()
+        logged_in = (saved_session and await restore_session(page)) or await test_login(page)
+        await page.close()
+
+        if logged_in:
+            await context.storage_state(path=AUTH_FILE)
+            # While one page waits on the app, the others keep dispatching actions
+            pending = asyncio.Queue()
+            selected = shard_tests(CALCULATOR_TESTS, SHARD)
+            for index, test in selected:
+                pending.put_nowait((index, test))
+            await asyncio.gather(*(run_worker(context, pending)
+                                   for _ in range(min(WORKERS, len(selected)))))
+        await browser.close()
 
 def main():
     """Main test runner"""
     print("Starting NICU Dashboard Calculator Tests...")
     print("="*60)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(viewport={"width": 1920, "height": 1080})
-        page = context.new_page()
-
-        # Run tests
-        if test_login(page):
-            test_calculators_page_access(page)
-            test_calculator_list(page)
-            test_ga_calculator(page)
-            test_corrected_age_calculator(page)
-            test_bilirubin_calculator(page)
-            test_fluid_calculator(page)
-            test_fluid_calculator_modifiers(page)
-            test_gir_calculator(page)
-            test_calorie_calculator(page)
-            test_apgar_calculator(page)
-            test_snappe_calculator(page)
-            test_dosing_calculator(page)
-            test_dosing_calculator_gentamicin(page)
-            test_feeding_page_nec_risk(page)
-            test_growth_page_percentiles(page)
-            test_growth_add_measurement(page)
-            test_input_validation_negative_weight(page)
-            test_input_validation_empty_fields(page)
-            test_units_display(page)
-
-        browser.close()
+    asyncio.run(run_tests())
 
     print_summary()
 
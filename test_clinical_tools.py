@@ -1,57 +1,205 @@
 #!/usr/bin/env python3
 """Test NICU Dashboard clinical tools"""
 
-from playwright.sync_api import sync_playwright
-import time
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from pathlib import Path
+import asyncio
+import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BASE_URL = 'http://localhost:3000'
+VIEWPORT = {'width': 1920, 'height': 1080}
+RESULTS_FILE = Path('/tmp/test_clinical_results.json')
+
+# Page checks run in parallel contexts; cap them so the dev server
+# is not flooded with page loads
+MAX_PARALLEL_CHECKS = 4
+
+# The checks only read text and click buttons; images, fonts, media and
+# analytics beacons are pure page-load overhead
+BLOCKED_RESOURCE_TYPES = frozenset(('image', 'font', 'media'))
+BLOCKED_HOSTS = ('google-analytics', 'googletagmanager', 'segment.io', 'mixpanel', 'sentry.io', 'hotjar')
+
+CALCULATORS_RE = re.compile(r'calculator|gir|fluid|dose')
+REPORTS_RE = re.compile(r'report|generate|export')
+NOT_FOUND_RE = re.compile(r'404|not found')
+
+CALCULATOR_INPUTS = 'input[type="number"], input:not([type="hidden"]):not([type="password"]):not([type="email"])'
+
+# Fills the first `limit` inputs matching the selector that are visible and
+# accept the value, through the native setter plus the input/change events
+# React listens for; returns [inputs found, inputs filled]
+FILL_VISIBLE_INPUTS_JS = """([selector, value, limit]) => {
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    const inputs = Array.from(document.querySelectorAll(selector));
+    let filled = 0;
+    for (const input of inputs.slice(0, limit)) {
+        const box = input.getBoundingClientRect();
+        if (!box.width || !box.height || input.disabled || input.readOnly) continue;
+        if (input.type === 'checkbox' || input.type === 'radio') continue;
+        setValue.call(input, value);
+        if (input.value !== value) continue;
+        input.dispatchEvent(new Event('input', {bubbles: true}));
+        input.dispatchEvent(new Event('change', {bubbles: true}));
+        filled++;
+    }
+    return [inputs.length, filled];
+}"""
+
+# Accessible names of the buttons the calculator and report steps press
+CALCULATE_BUTTON_RE = re.compile(r'calculate|compute|submit', re.I)
+GENERATE_BUTTON_RE = re.compile(r'generate|create|export', re.I)
+
+# (heading, result name, path, pattern whose match shows the page
+# rendered, pass message, topic for the warning, screenshot)
+PAGE_CHECKS = (
+    ("Trends Page (Vital Signs)", "Trends Page", "/trends",
+     re.compile(r'trend|vital|chart|graph|heart'),
+     "Trends/Vital signs page loaded", "trends", "07_trends"),
+    ("Devices Page", "Devices Page", "/devices",
+     re.compile(r'device|monitor|equipment|sensor'),
+     "Devices page loaded", "device", "10_devices"),
+    ("Discharge Planning Page", "Discharge Page", "/discharge",
+     re.compile(r'discharge|planning|checklist|criteria'),
+     "Discharge planning page loaded", "discharge", "11_discharge"),
+    ("Lab Results Integration", "Lab Results", "/labs",
+     re.compile(r'lab|result|blood|glucose'),
+     "Lab results page loaded", "lab", "12_labs"),
+    ("Medication Tracking", "Medication Tracking", "/medications",
+     re.compile(r'medication|drug|dose|prescription'),
+     "Medication tracking page loaded", "medication", "13_medications"),
+)
+
+async def block_unneeded_requests(route):
+    """Abort media and analytics requests the checks never look at"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def wait_until_settled(page):
+    """Wait for the page's data requests to finish instead of a fixed delay"""
+    try:
+        await page.wait_for_load_state('networkidle', timeout=10000)
+    except PlaywrightTimeoutError:
+        # Still fetching; check whatever has rendered so far
+        pass
+
+async def is_shown(locator, timeout):
+    """Wait up to timeout ms for the element to become visible
+
+    is_visible() ignores its timeout and answers immediately, so a form
+    still rendering was reported as missing.
+    """
+    try:
+        await locator.wait_for(state='visible', timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+async def page_text(page):
+    """Lowercased rendered text of the page, far smaller than its serialized HTML"""
+    return await page.evaluate("() => document.body.innerText.toLowerCase()")
+
+async def screenshot_on_problem(page, shot, step_results):
+    """Viewport screenshot of a step that failed or warned; passing steps take none"""
+    if all(status not in ("FAIL", "WARN") for _, status, _ in step_results):
+        return
+    try:
+        await page.screenshot(path=f'/tmp/test_clinical_{shot}.png')
+    except Exception as e:
+        print(f"Screenshot error: {e}")
+
+def print_console_error(msg):
+    if msg.type == "error":
+        print(f"Console [{msg.type}]: {msg.text}")
+
+async def probe_page(page, name, path, pattern, passed, topic):
+    """Load a page and return the result of looking for its expected content"""
+    try:
+        await page.goto(BASE_URL + path, timeout=30000)
+        await wait_until_settled(page)
+        print(f"{name} URL: {page.url}")
+
+        # Check if redirected to login (need authentication)
+        if '/login' in page.url:
+            return (name, "WARN", "Redirected to login - requires authentication")
+        text = await page_text(page)
+        if pattern.search(text):
+            return (name, "PASS", passed)
+        if NOT_FOUND_RE.search(text):
+            return (name, "FAIL", "404 - Page not found")
+        return (name, "WARN", f"Page loaded but {topic} content unclear")
+    except Exception as e:
+        print(f"{name} error: {e}")
+        return (name, "FAIL", str(e)[:100])
+
+async def check_page(browser, auth_state, limit, number, heading, name, path, pattern, passed, topic, shot):
+    """Probe one page in its own logged-in context and return its result"""
+    async with limit:
+        print(f"TEST {number}: {heading}")
+        context = await browser.new_context(viewport=VIEWPORT, storage_state=auth_state)
+        await context.route('**/*', block_unneeded_requests)
+        page = await context.new_page()
+        page.on("console", print_console_error)
+        try:
+            result = await probe_page(page, name, path, pattern, passed, topic)
+            await screenshot_on_problem(page, shot, [result])
+        finally:
+            await context.close()
+    return result
 
-def run_tests():
+async def run_tests():
     results = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(viewport={'width': 1920, 'height': 1080})
-        page = context.new_page()
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(viewport=VIEWPORT)
+        await context.route('**/*', block_unneeded_requests)
+        page = await context.new_page()
 
         # Enable console logging
-        page.on("console", lambda msg: print(f"Console [{msg.type}]: {msg.text}") if msg.type == "error" else None)
+        page.on("console", print_console_error)
 
         try:
             # Step 1: Login
+            step_start = len(results)
             print("=" * 60)
             print("TEST 1: Login to NICU Dashboard")
             print("=" * 60)
-            page.goto('http://localhost:3000/login', timeout=60000)
-            page.wait_for_load_state('domcontentloaded', timeout=30000)
-            time.sleep(2)
+            await page.goto('http://localhost:3000/login', timeout=60000)
+            await wait_until_settled(page)
             print(f"Current URL: {page.url}")
-            page.screenshot(path='/tmp/test_clinical_01_login_page.png', full_page=True)
 
-            # Clear and fill in login credentials
+            # Fill in login credentials
             try:
-                # Find and clear email field, then fill with admin credentials
+                # Find the email field, then fill with admin credentials
                 email_field = page.locator('input[type="email"], input[name="email"]').first
                 password_field = page.locator('input[type="password"]').first
 
-                if email_field.is_visible(timeout=5000):
+                if await is_shown(email_field, timeout=5000):
                     print("Found login form, filling credentials...")
-                    # Clear existing values and fill
-                    email_field.clear()
-                    email_field.fill('admin@hospital.org')
-                    password_field.clear()
-                    password_field.fill('admin123')
-                    time.sleep(1)
-                    page.screenshot(path='/tmp/test_clinical_02_login_filled.png', full_page=True)
+                    # fill() replaces any existing value
+                    await email_field.fill('admin@hospital.org')
+                    await password_field.fill('admin123')
 
                     # Click Sign In button
-                    sign_in_btn = page.locator('button:has-text("Sign In")').first
-                    if sign_in_btn.is_visible(timeout=3000):
+                    sign_in_btn = page.get_by_role('button', name='Sign In').first
+                    if await is_shown(sign_in_btn, timeout=3000):
                         print("Clicking Sign In button...")
-                        sign_in_btn.click()
-                        # Wait for navigation
-                        time.sleep(3)
-                        page.wait_for_load_state('domcontentloaded', timeout=30000)
-                        time.sleep(2)
-                        page.screenshot(path='/tmp/test_clinical_03_after_login.png', full_page=True)
+                        await sign_in_btn.click()
+                        # Wait for the redirect away from /login
+                        try:
+                            await page.wait_for_url(lambda url: '/login' not in url, timeout=10000)
+                        except PlaywrightTimeoutError:
+                            pass
+                        await wait_until_settled(page)
                         print(f"After login URL: {page.url}")
 
                         # Check if login was successful (not on login page anymore)
@@ -60,7 +208,7 @@ def run_tests():
                         else:
                             # Check for error message
                             error_msg = page.locator('.error, [role="alert"], .text-red').first
-                            if error_msg.count() > 0:
+                            if await error_msg.count() > 0:
                                 results.append(("Login", "FAIL", "Login failed - error message displayed"))
                             else:
                                 results.append(("Login", "WARN", "Still on login page after clicking Sign In"))
@@ -72,68 +220,40 @@ def run_tests():
             except Exception as e:
                 print(f"Login error: {e}")
                 results.append(("Login", "WARN", str(e)[:100]))
+            await screenshot_on_problem(page, '01_login', results[step_start:])
 
             # Step 2: Navigate to /calculators
+            step_start = len(results)
             print("\n" + "=" * 60)
             print("TEST 2: Calculators Page")
             print("=" * 60)
-            try:
-                page.goto('http://localhost:3000/calculators', timeout=30000)
-                page.wait_for_load_state('domcontentloaded', timeout=30000)
-                time.sleep(2)
-                print(f"Calculators URL: {page.url}")
-                page.screenshot(path='/tmp/test_clinical_04_calculators.png', full_page=True)
-
-                # Check if redirected to login (need authentication)
-                if '/login' in page.url:
-                    results.append(("Calculators Page Load", "WARN", "Redirected to login - requires authentication"))
-                else:
-                    content = page.content().lower()
-                    if 'calculator' in content or 'gir' in content or 'fluid' in content or 'dose' in content:
-                        results.append(("Calculators Page Load", "PASS", "Calculator page loaded"))
-                        print("Found calculator content on page")
-                    elif '404' in content or 'not found' in content:
-                        results.append(("Calculators Page Load", "FAIL", "404 - Page not found"))
-                    else:
-                        results.append(("Calculators Page Load", "WARN", "Page loaded but calculator content unclear"))
-
-            except Exception as e:
-                print(f"Calculators page error: {e}")
-                results.append(("Calculators Page", "FAIL", str(e)[:100]))
+            results.append(await probe_page(page, "Calculators Page Load", "/calculators", CALCULATORS_RE,
+                                            "Calculator page loaded", "calculator"))
+            await screenshot_on_problem(page, '04_calculators', results[step_start:])
 
             # Step 3: Test clinical calculators (GIR, fluid, dosing)
+            step_start = len(results)
             print("\n" + "=" * 60)
             print("TEST 3: Test Clinical Calculators")
             print("=" * 60)
             try:
                 if '/login' not in page.url:
-                    # Look for any input fields on calculator page
-                    inputs = page.locator('input[type="number"], input:not([type="hidden"]):not([type="password"]):not([type="email"])').all()
-                    print(f"Found {len(inputs)} input fields on calculator page")
-
-                    if len(inputs) >= 1:
-                        visible_inputs = 0
-                        for i, inp in enumerate(inputs[:5]):
-                            try:
-                                if inp.is_visible():
-                                    inp.fill('10')
-                                    visible_inputs += 1
-                            except:
-                                pass
-                        page.screenshot(path='/tmp/test_clinical_05_calculator_input.png', full_page=True)
-                        if visible_inputs > 0:
-                            results.append(("Calculator Inputs", "PASS", f"Filled {visible_inputs} input fields"))
+                    # Fill the first visible input fields on calculator page in one round-trip
+                    found, filled = await page.evaluate(FILL_VISIBLE_INPUTS_JS, [CALCULATOR_INPUTS, '10', 5])
+                    print(f"Found {found} input fields on calculator page")
+
+                    if found >= 1:
+                        if filled > 0:
+                            results.append(("Calculator Inputs", "PASS", f"Filled {filled} input fields"))
                         else:
                             results.append(("Calculator Inputs", "WARN", "No visible input fields to fill"))
                     else:
                         results.append(("Calculator Inputs", "SKIP", "No input fields found"))
 
                     # Look for calculate button
-                    calc_btn = page.locator('button:has-text("Calculate"), button:has-text("Compute"), button:has-text("Submit")').first
-                    if calc_btn.count() > 0 and calc_btn.is_visible(timeout=3000):
-                        calc_btn.click()
-                        time.sleep(1)
-                        page.screenshot(path='/tmp/test_clinical_06_calculator_result.png', full_page=True)
+                    calc_btn = page.get_by_role('button', name=CALCULATE_BUTTON_RE).first
+                    if await calc_btn.count() > 0 and await is_shown(calc_btn, timeout=3000):
+                        await calc_btn.click()
                         results.append(("Calculator Execution", "PASS", "Calculate button clicked"))
                     else:
                         results.append(("Calculator Execution", "SKIP", "No calculate button found"))
@@ -143,181 +263,47 @@ def run_tests():
             except Exception as e:
                 print(f"Calculator test error: {e}")
                 results.append(("Calculator Tests", "FAIL", str(e)[:100]))
+            await screenshot_on_problem(page, '05_calculator_input', results[step_start:])
 
-            # Step 4: Navigate to /trends
-            print("\n" + "=" * 60)
-            print("TEST 4: Trends Page (Vital Signs)")
-            print("=" * 60)
-            try:
-                page.goto('http://localhost:3000/trends', timeout=30000)
-                page.wait_for_load_state('domcontentloaded', timeout=30000)
-                time.sleep(2)
-                print(f"Trends URL: {page.url}")
-                page.screenshot(path='/tmp/test_clinical_07_trends.png', full_page=True)
-
-                if '/login' in page.url:
-                    results.append(("Trends Page", "WARN", "Redirected to login - requires authentication"))
-                else:
-                    content = page.content().lower()
-                    if 'trend' in content or 'vital' in content or 'chart' in content or 'graph' in content or 'heart' in content:
-                        results.append(("Trends Page", "PASS", "Trends/Vital signs page loaded"))
-                    elif '404' in content or 'not found' in content:
-                        results.append(("Trends Page", "FAIL", "404 - Page not found"))
-                    else:
-                        results.append(("Trends Page", "WARN", "Page loaded but trends content unclear"))
-
-            except Exception as e:
-                print(f"Trends page error: {e}")
-                results.append(("Trends Page", "FAIL", str(e)[:100]))
-
-            # Step 5: Navigate to /reports
+            # Step 4: Navigate to /reports
+            step_start = len(results)
             print("\n" + "=" * 60)
-            print("TEST 5: Reports Page")
+            print("TEST 4: Reports Page")
             print("=" * 60)
-            try:
-                page.goto('http://localhost:3000/reports', timeout=30000)
-                page.wait_for_load_state('domcontentloaded', timeout=30000)
-                time.sleep(2)
-                print(f"Reports URL: {page.url}")
-                page.screenshot(path='/tmp/test_clinical_08_reports.png', full_page=True)
-
-                if '/login' in page.url:
-                    results.append(("Reports Page", "WARN", "Redirected to login - requires authentication"))
-                else:
-                    content = page.content().lower()
-                    if 'report' in content or 'generate' in content or 'export' in content:
-                        results.append(("Reports Page", "PASS", "Reports page loaded"))
-
-                        # Try to generate a report
-                        gen_btn = page.locator('button:has-text("Generate"), button:has-text("Create"), button:has-text("Export")').first
-                        if gen_btn.count() > 0 and gen_btn.is_visible(timeout=3000):
-                            gen_btn.click()
-                            time.sleep(2)
-                            page.screenshot(path='/tmp/test_clinical_09_report_generated.png', full_page=True)
-                            results.append(("Report Generation", "PASS", "Generate button clicked"))
-                        else:
-                            results.append(("Report Generation", "SKIP", "No generate button found"))
-                    elif '404' in content or 'not found' in content:
-                        results.append(("Reports Page", "FAIL", "404 - Page not found"))
+            results.append(await probe_page(page, "Reports Page", "/reports", REPORTS_RE,
+                                            "Reports page loaded", "report"))
+            if results[-1][1] == "PASS":
+                # Try to generate a report
+                try:
+                    gen_btn = page.get_by_role('button', name=GENERATE_BUTTON_RE).first
+                    if await gen_btn.count() > 0 and await is_shown(gen_btn, timeout=3000):
+                        await gen_btn.click()
+                        await wait_until_settled(page)
+                        results.append(("Report Generation", "PASS", "Generate button clicked"))
                     else:
-                        results.append(("Reports Page", "WARN", "Page loaded but report content unclear"))
-
-            except Exception as e:
-                print(f"Reports page error: {e}")
-                results.append(("Reports Page", "FAIL", str(e)[:100]))
-
-            # Step 6: Navigate to /devices
+                        results.append(("Report Generation", "SKIP", "No generate button found"))
+                except Exception as e:
+                    print(f"Report generation error: {e}")
+                    results.append(("Report Generation", "FAIL", str(e)[:100]))
+            await screenshot_on_problem(page, '08_reports', results[step_start:])
+
+            # Steps 5-9: pages that only need to load and show their content,
+            # each in its own context started from this session's cookies
             print("\n" + "=" * 60)
-            print("TEST 6: Devices Page")
+            print(f"TESTS 5-{4 + len(PAGE_CHECKS)}: Page checks")
             print("=" * 60)
-            try:
-                page.goto('http://localhost:3000/devices', timeout=30000)
-                page.wait_for_load_state('domcontentloaded', timeout=30000)
-                time.sleep(2)
-                print(f"Devices URL: {page.url}")
-                page.screenshot(path='/tmp/test_clinical_10_devices.png', full_page=True)
-
-                if '/login' in page.url:
-                    results.append(("Devices Page", "WARN", "Redirected to login - requires authentication"))
-                else:
-                    content = page.content().lower()
-                    if 'device' in content or 'monitor' in content or 'equipment' in content or 'sensor' in content:
-                        results.append(("Devices Page", "PASS", "Devices page loaded"))
-                    elif '404' in content or 'not found' in content:
-                        results.append(("Devices Page", "FAIL", "404 - Page not found"))
-                    else:
-                        results.append(("Devices Page", "WARN", "Page loaded but device content unclear"))
-
-            except Exception as e:
-                print(f"Devices page error: {e}")
-                results.append(("Devices Page", "FAIL", str(e)[:100]))
-
-            # Step 7: Navigate to /discharge
-            print("\n" + "=" * 60)
-            print("TEST 7: Discharge Planning Page")
-            print("=" * 60)
-            try:
-                page.goto('http://localhost:3000/discharge', timeout=30000)
-                page.wait_for_load_state('domcontentloaded', timeout=30000)
-                time.sleep(2)
-                print(f"Discharge URL: {page.url}")
-                page.screenshot(path='/tmp/test_clinical_11_discharge.png', full_page=True)
-
-                if '/login' in page.url:
-                    results.append(("Discharge Page", "WARN", "Redirected to login - requires authentication"))
-                else:
-                    content = page.content().lower()
-                    if 'discharge' in content or 'planning' in content or 'checklist' in content or 'criteria' in content:
-                        results.append(("Discharge Page", "PASS", "Discharge planning page loaded"))
-                    elif '404' in content or 'not found' in content:
-                        results.append(("Discharge Page", "FAIL", "404 - Page not found"))
-                    else:
-                        results.append(("Discharge Page", "WARN", "Page loaded but discharge content unclear"))
-
-            except Exception as e:
-                print(f"Discharge page error: {e}")
-                results.append(("Discharge Page", "FAIL", str(e)[:100]))
-
-            # Step 8: Check Lab Results Integration
-            print("\n" + "=" * 60)
-            print("TEST 8: Lab Results Integration")
-            print("=" * 60)
-            try:
-                page.goto('http://localhost:3000/labs', timeout=30000)
-                page.wait_for_load_state('domcontentloaded', timeout=30000)
-                time.sleep(2)
-                print(f"Labs URL: {page.url}")
-                page.screenshot(path='/tmp/test_clinical_12_labs.png', full_page=True)
-
-                if '/login' in page.url:
-                    results.append(("Lab Results", "WARN", "Redirected to login - requires authentication"))
-                else:
-                    content = page.content().lower()
-                    if 'lab' in content or 'result' in content or 'blood' in content or 'glucose' in content:
-                        results.append(("Lab Results", "PASS", "Lab results page loaded"))
-                    elif '404' in content or 'not found' in content:
-                        results.append(("Lab Results", "FAIL", "404 - Page not found"))
-                    else:
-                        results.append(("Lab Results", "WARN", "Page loaded but lab content unclear"))
-
-            except Exception as e:
-                print(f"Lab results error: {e}")
-                results.append(("Lab Results", "FAIL", str(e)[:100]))
-
-            # Step 9: Verify Medication Tracking
-            print("\n" + "=" * 60)
-            print("TEST 9: Medication Tracking")
-            print("=" * 60)
-            try:
-                page.goto('http://localhost:3000/medications', timeout=30000)
-                page.wait_for_load_state('domcontentloaded', timeout=30000)
-                time.sleep(2)
-                print(f"Medications URL: {page.url}")
-                page.screenshot(path='/tmp/test_clinical_13_medications.png', full_page=True)
-
-                if '/login' in page.url:
-                    results.append(("Medication Tracking", "WARN", "Redirected to login - requires authentication"))
-                else:
-                    content = page.content().lower()
-                    if 'medication' in content or 'drug' in content or 'dose' in content or 'prescription' in content:
-                        results.append(("Medication Tracking", "PASS", "Medication tracking page loaded"))
-                    elif '404' in content or 'not found' in content:
-                        results.append(("Medication Tracking", "FAIL", "404 - Page not found"))
-                    else:
-                        results.append(("Medication Tracking", "WARN", "Page loaded but medication content unclear"))
-
-            except Exception as e:
-                print(f"Medication tracking error: {e}")
-                results.append(("Medication Tracking", "FAIL", str(e)[:100]))
+            auth_state = await context.storage_state()
+            limit = asyncio.Semaphore(MAX_PARALLEL_CHECKS)
+            results.extend(await asyncio.gather(*(check_page(browser, auth_state, limit, number, *check)
+                                                  for number, check in enumerate(PAGE_CHECKS, start=5))))
 
             # Final dashboard screenshot
             print("\n" + "=" * 60)
             print("Taking final overview screenshots")
             print("=" * 60)
-            page.goto('http://localhost:3000/dashboard', timeout=30000)
-            page.wait_for_load_state('domcontentloaded', timeout=30000)
-            time.sleep(2)
-            page.screenshot(path='/tmp/test_clinical_14_final_overview.png', full_page=True)
+            await page.goto('http://localhost:3000/dashboard', timeout=30000)
+            await wait_until_settled(page)
+            await page.screenshot(path='/tmp/test_clinical_14_final_overview.png', full_page=True)
 
         except Exception as e:
             print(f"Overall test error: {e}")
@@ -326,7 +312,7 @@ def run_tests():
             results.append(("Overall Test", "FAIL", str(e)[:100]))
 
         finally:
-            browser.close()
+            await browser.close()
 
     # Print results summary
     print("\n" + "=" * 60)
@@ -359,9 +345,27 @@ def run_tests():
     print(f"  SKIP: {skip_count}")
     print("-" * 60)
 
-    print("\nScreenshots saved to /tmp/test_clinical_*.png")
+    # Save results to JSON, same layout as the calculator suite's report
+    report = {
+        "summary": {
+            "total": len(results),
+            "passed": pass_count,
+            "failed": fail_count,
+            "warned": warn_count,
+            "skipped": skip_count,
+        },
+        "results": [{"test": test_name, "status": status, "details": message}
+                    for test_name, status, message in results],
+    }
+    if orjson is not None:
+        RESULTS_FILE.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        RESULTS_FILE.write_text(json.dumps(report, indent=2))
+    print(f"\nResults saved to {RESULTS_FILE}")
+
+    print("\nOverview and failing-step screenshots saved to /tmp/test_clinical_*.png")
 
     return results
 
 if __name__ == "__main__":
-    run_tests()
+    asyncio.run(run_tests())
@@ -32,15 +32,13 @@ def run_tests():
                 time.sleep(1)
                 print("  Clicked Email & Password tab")
 
-            # Clear any existing values and fill in credentials
+            # Fill in credentials; fill() replaces any existing value
             email_field = page.locator('input[type="email"], input[name="email"], input[placeholder*="email" i], input[id*="email" i]').first
-            email_field.clear()
             email_field.fill('admin@hospital.org')
             print("  Filled email: admin@hospital.org")
 
             # Find password field
             password_field = page.locator('input[type="password"]').first
-            password_field.clear()
             password_field.fill('admin123')
             print("  Filled password")
 
@@ -79,11 +77,9 @@ def run_tests():
                 time.sleep(1)
 
             email_field = page.locator('input[type="email"], input[name="email"]').first
-            email_field.clear()
             email_field.fill('admin@hospital.org')
 
             password_field = page.locator('input[type="password"]').first
-            password_field.clear()
             password_field.fill('admin123')
 
             login_button = page.locator('button:has-text("Sign In")').first
@@ -39,12 +39,10 @@ def run_tests():
             # Find and fill email input
             email_input = page.locator('input[type="email"]')
             email_input.wait_for(timeout=10000)
-            email_input.clear()
             email_input.fill('admin@hospital.org')
 
             # Find and fill password input
             password_input = page.locator('input[type="password"]')
-            password_input.clear()
             password_input.fill('admin123')
 
             # Take screenshot before clicking login
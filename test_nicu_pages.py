@@ -36,14 +36,12 @@ def test_nicu_dashboard():
                     email_tab.first.click()
                     page.wait_for_timeout(500)
 
-                # Clear and fill email
+                # Fill email
                 email_input = page.locator('input[type="email"], input[name="email"], input[id*="email" i]').first
-                email_input.clear()
                 email_input.fill('admin@hospital.org')
 
-                # Clear and fill password
+                # Fill password
                 password_input = page.locator('input[type="password"], input[name="password"]').first
-                password_input.clear()
                 password_input.fill('admin123')
 
                 page.screenshot(path='/tmp/test_settings_02_credentials.png')
@@ -29,11 +29,9 @@ def run_tests():
             email_input = page.locator('input[type="email"], input[name="email"], input[placeholder*="mail"]').first
             password_input = page.locator('input[type="password"], input[name="password"]').first
 
-            # Clear existing values and fill
-            email_input.clear()
+            # fill() replaces any existing value
             email_input.fill('admin@hospital.org')
 
-            password_input.clear()
             password_input.fill('admin123')
 
             page.screenshot(path='/tmp/test_patient_detail_01_login_filled.png', full_page=True)
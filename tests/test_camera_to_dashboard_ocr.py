@@ -0,0 +1,82 @@
+"""
+Test the per-ROI OCR reuse gate in scripts/camera-to-dashboard-ocr.py
+Cached ROI text must be re-read when the digits change or the cache ages out
+"""
+import importlib.util
+import os
+from unittest import mock
+
+import cv2
+import numpy as np
+import pytest
+
+pytest.importorskip('pytesseract')
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'camera-to-dashboard-ocr.py')
+
+
+def load_connector():
+    spec = importlib.util.spec_from_file_location('camera_to_dashboard_ocr', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+ocr = load_connector()
+
+HR_ROI = (0, 100, 0, 240)
+
+
+def monitor_frame(hr):
+    frame = np.zeros((100, 240), dtype=np.uint8)
+    cv2.putText(frame, str(hr), (10, 80), cv2.FONT_HERSHEY_SIMPLEX, 2.5, 255, 6)
+    return frame
+
+
+@pytest.fixture
+def tesseract():
+    """Tesseract stand-in returning the queued readings in order"""
+    readings = []
+    with mock.patch.object(ocr, 'ROIS', {'hr': HR_ROI}), \
+            mock.patch.dict(ocr._roi_cache, clear=True), \
+            mock.patch.object(ocr, 'preprocess_roi', lambda gray: gray), \
+            mock.patch.object(ocr, 'ocr_image', side_effect=lambda *a: readings.pop(0)) as ocr_image:
+        ocr_image.readings = readings
+        yield ocr_image
+
+
+def test_unchanged_roi_reuses_ocr(tesseract):
+    tesseract.readings.extend(['142'])
+    frame = monitor_frame(142)
+
+    ocr.extract_vitals_rois(frame)
+    vitals, _, _ = ocr.extract_vitals_rois(cv2.add(frame, 3))
+
+    assert tesseract.call_count == 1
+    assert vitals['hr'] == 142
+
+
+def test_changed_digit_forces_ocr(tesseract):
+    tesseract.readings.extend(['142', '186'])
+
+    ocr.extract_vitals_rois(monitor_frame(142))
+    vitals, _, _ = ocr.extract_vitals_rois(monitor_frame(186))
+
+    assert tesseract.call_count == 2
+    assert vitals['hr'] == 186
+
+
+def test_misread_expires(tesseract):
+    # Tesseract misreads a steady 142 once; the reuse must not outlive the refresh
+    tesseract.readings.extend(['148', '142'])
+    frame = monitor_frame(142)
+
+    vitals, _, _ = ocr.extract_vitals_rois(frame)
+    assert vitals['hr'] == 148
+
+    thumb, text, ocr_time = ocr._roi_cache['hr']
+    ocr._roi_cache['hr'] = (thumb, text, ocr_time - ocr.ROI_OCR_REFRESH_SEC)
+    vitals, _, _ = ocr.extract_vitals_rois(frame)
+
+    assert tesseract.call_count == 2
+    assert vitals['hr'] == 142
@@ -0,0 +1,98 @@
+"""
+Test the OCR reuse gate in pi-zero-setup/scripts/central-ocr-processor.py
+A changed digit on the monitor must always reach OCR again
+"""
+import importlib.util
+import logging
+import os
+from unittest import mock
+
+import cv2
+import numpy as np
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'pi-zero-setup', 'scripts',
+                      'central-ocr-processor.py')
+
+
+def load_processor():
+    # The script logs to /var/log at import time
+    with mock.patch('logging.FileHandler', lambda *a, **k: logging.NullHandler()):
+        spec = importlib.util.spec_from_file_location('central_ocr_processor', SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+ocr = load_processor()
+
+
+class CountingExtractor:
+    def __init__(self):
+        self.calls = 0
+
+    def extract_vitals(self, screen_img, patient_id):
+        self.calls += 1
+        return {'hr': self.calls, 'spo2': 95, 'rr': 42, 'temp': 36.8,
+                'hr_conf': 0.9, 'spo2_conf': 0.9, 'rr_conf': 0.9, 'temp_conf': 0.9}
+
+
+def monitor_screen(hr):
+    screen = np.zeros((480, 640, 3), dtype=np.uint8)
+    cv2.putText(screen, 'HR', (40, 80), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 255, 0), 2)
+    cv2.putText(screen, str(hr), (40, 200), cv2.FONT_HERSHEY_SIMPLEX, 3, (0, 255, 0), 6)
+    cv2.putText(screen, 'SpO2 95', (360, 200), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 255, 255), 3)
+    return screen
+
+
+def make_processor():
+    config = ocr.CameraConfig(patient_id=1, camera_id='cam1', rtsp_url='rtsp://test')
+    extractor = CountingExtractor()
+    return ocr.CameraStreamProcessor(config, extractor, mqtt_client=None), extractor
+
+
+def test_unchanged_screen_reuses_ocr():
+    processor, extractor = make_processor()
+    screen = monitor_screen(142)
+
+    first = processor._read_vitals(screen)
+    noisy = cv2.add(screen, np.full_like(screen, 3))
+    assert processor._read_vitals(noisy) is first
+    assert extractor.calls == 1
+
+
+def test_changed_digit_forces_ocr():
+    processor, extractor = make_processor()
+
+    processor._read_vitals(monitor_screen(142))
+    vitals = processor._read_vitals(monitor_screen(186))
+
+    assert extractor.calls == 2
+    assert vitals['hr'] == 2
+
+
+def test_reused_vitals_expire():
+    processor, extractor = make_processor()
+    screen = monitor_screen(142)
+
+    processor._read_vitals(screen)
+    processor._last_ocr_time -= ocr.OCR_REFRESH_SEC
+    processor._read_vitals(screen)
+
+    assert extractor.calls == 2
+
+
+def test_pool_mode_starts_no_mqtt_thread_before_fork(tmp_path):
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text(
+        'mqtt: {broker: localhost, port: 1883}\n'
+        'processing: {use_process_pool: true}\n'
+        'cameras:\n'
+        '  - {patient_id: 1, camera_id: cam1, rtsp_url: "rtsp://test"}\n'
+    )
+
+    with mock.patch.object(ocr.mqtt, 'Client') as client:
+        processor = ocr.CentralOCRProcessor(str(config_file))
+
+    assert processor.use_process_pool
+    assert processor.mqtt_client is None
+    client.assert_not_called()